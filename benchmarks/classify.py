@@ -0,0 +1,82 @@
+"""
+Compares the classification predicates to their previous exception-driven
+versions, on the builtin types of tests/_test_basetypes.py and their methods.
+"""
+from timeit import repeat
+from typing import Any, Callable, cast, get_origin, get_overloads, is_typeddict
+
+from typing_extensions import is_protocol
+
+from intersection_examples import classify, get_possible_methods, is_callable
+
+base_types = (
+    int,
+    float,
+    str,
+    bytes,
+    bytearray,
+    bool,
+    type,
+    BaseException,
+    set,
+    list,
+    tuple,
+    range,
+    memoryview,
+    dict,
+    frozenset,
+    complex,
+)
+methods = [getattr(i, name) for i in base_types for name in ("__repr__", "__eq__")]
+
+
+def old_is_callable(cls: object) -> bool:
+    try:
+        out = issubclass(cast(Any, get_origin(cls)), Callable)
+    except:
+        out = False
+    return out
+
+
+def old_get_possible_methods(method: Callable) -> list[Callable]:
+    try:
+        overloads = get_overloads(method)
+    except:
+        overloads = []
+    if len(overloads) == 0:
+        return [method]
+    else:
+        return overloads
+
+
+def old_is_non_structural(cls: object) -> bool:
+    if cls == Any or is_protocol(cls) or is_typeddict(cls) or old_is_callable(cls):
+        return False
+    return True
+
+
+def run(func: Callable[[Any], object], items: Any) -> float:
+    def loop() -> None:
+        for i in items:
+            func(i)
+
+    return min(repeat(loop, number=1_000)) / len(items) * 1e3
+
+
+cases = {
+    "is_callable": (old_is_callable, is_callable, base_types),
+    "get_possible_methods": (
+        old_get_possible_methods,
+        get_possible_methods,
+        methods,
+    ),
+    "classify": (old_is_non_structural, classify, base_types),
+}
+
+for name, (old, new, items) in cases.items():
+    before = run(old, items)
+    after = run(new, items)
+    print(
+        f"{name}: before {before:.3f}us, after {after:.3f}us,"
+        f" {before / after:.1f}x faster"
+    )
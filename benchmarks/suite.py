@@ -0,0 +1,217 @@
+"""
+Times the resolution paths of Intersection on the scenarios of examples/, and
+on intersections of 2 to 500 generated classes.
+
+Every benchmark reports the best time per operation over several runs:
+    getitem         Intersection[...] of an interned intersection
+    construct       normalizing the components and creating a new Intersection
+    resolve         attribute access served by the member cache
+    resolve_cold    attribute access after clearing the member cache
+    missing         access to a missing attribute served by the member cache
+    missing_cold    access to a missing attribute after clearing the cache
+
+After every scenario, the speedup of the member cache is printed, i.e. the
+ratio of resolve_cold to resolve and of missing_cold to missing.
+    must_subclass   the must_subclass property, unless it evaluates to Never
+
+Usage:
+    python benchmarks/suite.py --json results.json
+    python benchmarks/suite.py --compare results.json --tolerance 1.25
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+from pathlib import Path
+from runpy import run_path
+from timeit import Timer
+from typing import Any, Callable
+
+from intersection_examples import Intersection, normalize
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
+
+# example -> (components from the namespace of the example, attribute to resolve)
+SCENARIOS: dict[str, tuple[Callable[[dict[str, Any]], tuple[Any, ...]], str]] = {
+    "basic": (lambda ns: (ns["A"], ns["B"]), "foo"),
+    "overloads": (lambda ns: (ns["A"], ns["B"]), "foo"),
+    "overloaded_already": (lambda ns: (ns["A"], ns["B"]), "foo"),
+    "callables": (lambda ns: ns["test"].__intersects__, "__call__"),
+    "callable_and_proto": (
+        lambda ns: (ns["Callable"][[int, str], int], ns["Proto"]),
+        "__call__",
+    ),
+    "any_intersect": (lambda ns: (ns["A"], ns["B"], Any), "x"),
+    "base_types": (lambda ns: (int, str), "strip"),
+}
+
+SIZES = (2, 10, 50, 100, 500)
+
+# Name of an attribute of none of the components
+MISSING = "not_a_member"
+
+
+def load_example(name: str) -> dict[str, Any]:
+    # The examples print their results when run
+    with contextlib.redirect_stdout(io.StringIO()):
+        return run_path(str(EXAMPLES / f"{name}.py"))
+
+
+def generate_classes(count: int) -> tuple[type, ...]:
+    """
+    Creates unrelated classes sharing a method with distinct signatures, and
+    each with its own annotated attribute.
+    """
+    out = []
+    for x in range(count):
+
+        def foo(self, value):
+            return value
+
+        cls = type(f"C{x}", (), {"foo": foo, "__annotations__": {"a": int}})
+        foo.__annotations__ = {"value": int, "return": cls}
+        out.append(cls)
+    return tuple(out)
+
+
+def time_per_op(func: Callable[[], object], repeat: int, min_time: float) -> float:
+    timer = Timer(func)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            break
+        number *= 10
+    return min(timer.repeat(repeat, number)) / number
+
+
+def benchmarks(key: tuple[Any, ...], attribute: str) -> dict[str, Callable[[], object]]:
+    intersection = Intersection[key]
+
+    def construct() -> object:
+        components, never = normalize(key)
+        return Intersection(*components, never=never)
+
+    def resolve_cold() -> object:
+        intersection.cache_clear()
+        return getattr(intersection, attribute)
+
+    def missing() -> object:
+        return getattr(intersection, MISSING, None)
+
+    def missing_cold() -> object:
+        intersection.cache_clear()
+        return getattr(intersection, MISSING, None)
+
+    out = {
+        "getitem": lambda: Intersection[key],
+        "construct": construct,
+        "resolve": lambda: getattr(intersection, attribute),
+        "resolve_cold": resolve_cold,
+        "missing": missing,
+        "missing_cold": missing_cold,
+    }
+    if not intersection.is_never:
+        out["must_subclass"] = lambda: intersection.must_subclass
+    return out
+
+
+def run(
+    scenarios: list[str], sizes: list[int], repeat: int, min_time: float
+) -> list[dict[str, Any]]:
+    cases: list[tuple[str, tuple[Any, ...], str]] = []
+    for name in scenarios:
+        components, attribute = SCENARIOS[name]
+        cases.append((name, components(load_example(name)), attribute))
+    for size in sizes:
+        cases.append(("scaling", generate_classes(size), "foo"))
+
+    results = []
+    for scenario, key, attribute in cases:
+        seconds = {}
+        for benchmark, func in benchmarks(key, attribute).items():
+            seconds[benchmark] = time_per_op(func, repeat, min_time)
+            results.append(
+                {
+                    "scenario": scenario,
+                    "components": len(key),
+                    "benchmark": benchmark,
+                    "seconds": seconds[benchmark],
+                }
+            )
+            print(
+                f"{scenario:<20} {len(key):>4} {benchmark:<14}"
+                f" {seconds[benchmark] * 1e6:10.3f}us"
+            )
+        print(
+            f"{scenario:<20} {len(key):>4} cache speedup"
+            f" {seconds['resolve_cold'] / seconds['resolve']:8.1f}x hit"
+            f" {seconds['missing_cold'] / seconds['missing']:8.1f}x miss"
+        )
+    return results
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: list[dict[str, Any]], tolerance: float
+) -> bool:
+    """
+    Prints the ratio of every result to the same benchmark in the baseline.
+
+    Returns:
+        bool: True if no benchmark is slower than the baseline by more than
+            the tolerance
+    """
+    before = {(i["scenario"], i["components"], i["benchmark"]): i for i in baseline}
+    ok = True
+    for i in results:
+        old = before.get((i["scenario"], i["components"], i["benchmark"]))
+        if old is None:
+            continue
+        ratio = i["seconds"] / old["seconds"]
+        regression = ratio > tolerance
+        ok = ok and not regression
+        print(
+            f"{i['scenario']:<20} {i['components']:>4} {i['benchmark']:<14}"
+            f" {ratio:6.2f}x{'  REGRESSION' if regression else ''}"
+        )
+    return ok
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS))
+    parser.add_argument("--size", action="append", type=int)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--json", type=Path, help="file to write the results to")
+    parser.add_argument("--compare", type=Path, help="results of an earlier run")
+    parser.add_argument("--tolerance", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    results = run(
+        args.scenario or list(SCENARIOS),
+        args.size or list(SIZES),
+        args.repeat,
+        args.min_time,
+    )
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "implementation": platform.python_implementation(),
+                    "results": results,
+                },
+                indent=2,
+            )
+        )
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        if not compare(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,14 +8,16 @@ class A:
         ...
 
 
-test = Intersection[A, Any]
+class B:
+    x: str
+
+
+test = Intersection[A, B, Any]
 print(test)
 print("foo", test.foo)
 print("x", test.x)
 print(test.must_subclass)
 print()
+# Any is removed from an intersection, leaving only A
 test = Intersection[Any, A]
 print(test)
-print("foo", test.foo)
-print("x", test.x)
-print(test.must_subclass)
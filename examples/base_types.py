@@ -4,4 +4,4 @@ test = Intersection[int, str]
 print(test)
 print(test.strip)
 print(test.numerator)
-print(test.must_subclass)
+print(test.is_never)
@@ -1,53 +1,268 @@
-__all__ = ["Intersection"]
+__all__ = [
+    "CacheInfo",
+    "Dispatcher",
+    "EagerIntersection",
+    "Intersection",
+    "Overload",
+    "clear_caches",
+    "disable_instrumentation",
+    "enable_instrumentation",
+    "get_signatures",
+    "get_type_hints",
+    "instrumentation_enabled",
+    "instrumentation_snapshot",
+    "merge_typed_dicts",
+    "layout_conflict",
+    "normalize",
+    "reset_instrumentation",
+    "signature_cache_info",
+    "solid_base",
+    "validate_stream",
+]
 """
 The idea of this is to simulate the return type of an intersection of two classes.
 This currently only works for direct methods or attributes of the class.
 """
-from inspect import Parameter, Signature, signature as sig_func
+import os
+import sys
+from collections import OrderedDict, deque
+from itertools import islice, product
+from operator import attrgetter, getitem
+from struct import calcsize
+from time import perf_counter
+from types import (
+    BuiltinMethodType,
+    FunctionType,
+    MappingProxyType,
+    MethodType,
+    MethodWrapperType,
+    NoneType,
+    UnionType,
+)
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
-    Self,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Never,
+    NoReturn,
+    NotRequired,
     Sequence,
+    TypedDict,
+    Union,
     cast,
     get_args,
     get_origin,
-    get_overloads,
+    get_type_hints as typing_get_type_hints,
     is_typeddict,
 )
-from typing_extensions import is_protocol
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
+if TYPE_CHECKING:
+    from inspect import Signature
+
+    from intersection_examples.signatures import Dispatcher
+
+# Members of intersection_examples.signatures, which is imported on first use
+SIGNATURE_MEMBERS = {
+    "Dispatcher",
+    "Overload",
+    "annotation_matches",
+    "callable_signature",
+    "get_possible_methods",
+    "get_signatures",
+    "positional_annotation",
+    "signature_cache_info",
+    "signature_matches",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in SIGNATURE_MEMBERS:
+        from intersection_examples import signatures
+
+        return getattr(signatures, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *SIGNATURE_MEMBERS})
+
+
+def is_protocol(tp: object) -> bool:
+    # Only protocols set _is_protocol, so typing_extensions is only imported once
+    # a protocol is seen
+    if not (isinstance(tp, type) and getattr(tp, "_is_protocol", False)):
+        return False
+    from typing_extensions import is_protocol
+
+    return is_protocol(tp)
+
+
+def get_protocol_members(tp: type) -> frozenset[str]:
+    from typing_extensions import get_protocol_members
 
+    return get_protocol_members(tp)
 
-get_attribute_excludes = [
+
+get_attribute_excludes = {
     "__intersects__",
     "__callables__",
     "__class__",
     "__init_subclass__",
     "__subclasshook__",
     "__new__",
+    "__never__",
+    "__type_hints__",
+    "__typed_dict__",
+    "typed_dict",
+    "__type_verdicts__",
+    "__member_cache__",
+    "__cache_stats__",
     "must_subclass",
-]
+    "is_never",
+    "cache_info",
+    "cache_clear",
+    "compile_validator",
+    "__validator__",
+    "__reduce__",
+    "__reduce_ex__",
+    "__dispatchers__",
+    "dispatcher",
+    "__members__",
+    "resolve_all",
+    "__kinds__",
+    "__kind_summary__",
+    "__materialized__",
+    "materialize",
+    "__proxies__",
+    "wrap",
+}
 
+POINTER_SIZE = calcsize("P")
 
-def get_possible_methods(method: Callable) -> Sequence[Callable]:
-    try:
-        overloads = get_overloads(method)
-    except:
-        overloads = []
-    if len(overloads) == 0:
-        return [method]
-    else:
-        return overloads
+# Marker for a missing attribute, and for a cached AttributeError
+_MISSING = object()
 
+# Kinds of components, packed per component into Intersection.__kinds__
+NOMINAL = 1
+STRUCTURAL = 2
+ANY = 4
+CALLABLE = 8
+KIND_BITS = 4
 
-def is_callable(cls: object) -> bool:
-    try:
-        out = issubclass(cast(Any, get_origin(cls)), Callable)
-    except:
-        out = False
+
+class MissingMember(AttributeError):
+    """
+    Raised for a missing member of an intersection. The message is only
+    formatted when shown, as the repr of a large intersection is costly and
+    the error is usually caught, e.g. by getattr with a default.
+    """
+
+    def __str__(self) -> str:
+        return f"Attribute {self.name} not found on type {self.obj}"
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the resolved-member cache of an Intersection"""
+
+    hits: int
+    misses: int
+    currsize: int
+
+
+# Memoized results of classify
+_kinds: "WeakKeyDictionary[type, int]" = WeakKeyDictionary()
+
+# Memoized results of solid_base
+_solid_bases: "WeakKeyDictionary[type, type]" = WeakKeyDictionary()
+
+# Canonical Intersection instances, keyed on their components. Entries disappear
+# together with the Intersection, so the intersected classes can be collected.
+_interned: "WeakValueDictionary[tuple[object, ...], Intersection]" = (
+    WeakValueDictionary()
+)
+
+# Maximum number of keys, given or canonical, of the intersections kept alive by
+# _recent
+INTERN_CACHE_SIZE = 256
+
+# The most recently used intersections, so those that nobody holds, e.g.
+# Intersection[A, B] evaluated in a loop, keep their caches
+_recent: "OrderedDict[tuple[object, ...], Intersection]" = OrderedDict()
+
+# Classes created by Intersection.materialize, keyed on the components of their
+# intersection. An entry lives as long as its class, so the same class is
+# returned for as long as it is used anywhere, even once its intersection was
+# collected.
+_materialized: "WeakValueDictionary[tuple[object, ...], type]" = WeakValueDictionary()
+
+# component -> name -> (annotation or signatures as found, with forward references
+# resolved)
+_forward_refs: "WeakKeyDictionary[type, dict[str, tuple[Any, Any]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def clear_caches() -> None:
+    """
+    Clears the module level caches (signatures, solid bases, kinds and
+    forward references) and the member caches of all interned intersections,
+    and releases the recently used intersections.
+    """
+    signatures = sys.modules.get("intersection_examples.signatures")
+    if signatures is not None:
+        signatures._signatures.clear()
+        signatures._signature_stats[:] = [0, 0]
+    _solid_bases.clear()
+    _kinds.clear()
+    _forward_refs.clear()
+    for i in list(_interned.values()):
+        i.cache_clear()
+    _recent.clear()
+
+
+def lookup_interned(key: tuple[object, ...]) -> "Intersection | None":
+    """
+    Finds the canonical intersection for a key of _interned, marking it as
+    recently used.
+    Args:
+        key (tuple[object, ...]): The class of the intersection and its
+            components
+
+    Raises:
+        TypeError: The key is unhashable
+
+    Returns:
+        Intersection | None: The intersection, None if there is none
+    """
+    out = _recent.get(key)
+    if out is not None:
+        _recent.move_to_end(key)
+        return out
+    out = _interned.get(key)
+    if out is not None:
+        remember(key, out)
     return out
 
 
+def remember(key: tuple[object, ...], intersection: "Intersection") -> None:
+    # Interns the intersection, keeping it alive until INTERN_CACHE_SIZE more
+    # recently used keys are looked up
+    _interned[key] = intersection
+    _recent[key] = intersection
+    if len(_recent) > INTERN_CACHE_SIZE:
+        _recent.popitem(last=False)
+
+
+def is_callable(cls: object) -> bool:
+    origin = get_origin(cls)
+    return isinstance(origin, type) and issubclass(origin, cast(type, Callable))
+
+
 def is_non_structural(cls: object) -> bool:
     """
     We wish to determine if the given class is to be considered structural,
@@ -58,39 +273,1090 @@ def is_non_structural(cls: object) -> bool:
     Returns:
         bool: True is the class is non-structural
     """
+    return classify(cls) == NOMINAL
+
+
+def classify(cls: object) -> int:
+    """
+    Determines the kind of a component of an intersection.
+    The result is memoized per class.
+    Args:
+        cls (object): Component to be classified
+
+    Returns:
+        int: ANY, CALLABLE, STRUCTURAL (protocols and TypedDicts) or NOMINAL
+    """
+    if not isinstance(cls, type):
+        return compute_kind(cls)
+    kind = _kinds.get(cls)
+    if kind is None:
+        kind = _kinds[cls] = compute_kind(cls)
+    return kind
+
+
+def compute_kind(cls: object) -> int:
+    if cls == Any:
+        return ANY
+    elif is_callable(cls):
+        return CALLABLE
+    elif is_protocol(cls) or is_typeddict(cls):  # type:ignore
+        return STRUCTURAL
+    return NOMINAL
+
+
+def classify_all(intersects: Sequence[object]) -> tuple[int, int]:
+    """
+    Classifies all components of an intersection.
+    Args:
+        intersects (Sequence[object]): Components of the intersection
+
+    Returns:
+        tuple[int, int]: The kinds of the components, KIND_BITS bits each with
+            the first component in the lowest bits, and the union of all kinds
+    """
+    kinds = summary = 0
+    for x, i in enumerate(intersects):
+        kind = classify(i)
+        kinds |= kind << (KIND_BITS * x)
+        summary |= kind
+    return kinds, summary
+
+
+def component_kind(kinds: int, index: int) -> int:
+    return (kinds >> (KIND_BITS * index)) & ((1 << KIND_BITS) - 1)
+
+
+def is_union(tp: object) -> bool:
+    return get_origin(tp) in (Union, UnionType)
+
+
+def has_extra_layout(cls: type, base: type) -> bool:
+    """
+    Determines if instances of cls store more than instances of base,
+    mirroring `extra_ivars` in CPython's typeobject.c.
+    Args:
+        cls (type): Class to be inspected
+        base (type): Solid base of the base class of cls
+
+    Returns:
+        bool: True if cls changes the instance layout
+    """
+    size, base_size = cls.__basicsize__, base.__basicsize__
+    if cls.__itemsize__ or base.__itemsize__:
+        return size != base_size or cls.__itemsize__ != base.__itemsize__
+    # __weakref__ and __dict__ slots added by a subclass don't count
+    if (
+        cls.__weakrefoffset__
+        and not base.__weakrefoffset__
+        and cls.__weakrefoffset__ + POINTER_SIZE == size
+    ):
+        size -= POINTER_SIZE
     if (
-        cls == Any
-        or is_protocol(cls)  # type:ignore
-        or is_typeddict(cls)
-        or is_callable(cls)
+        cls.__dictoffset__
+        and not base.__dictoffset__
+        and cls.__dictoffset__ + POINTER_SIZE == size
     ):
+        size -= POINTER_SIZE
+    return size != base_size
+
+
+def solid_base(cls: type) -> type:
+    """
+    Finds the class defining the instance layout of the given class.
+    Two classes can only be subclassed together if the solid base of one is a
+    subclass of the solid base of the other, e.g. int and str can't.
+    The result is memoized per class.
+    Args:
+        cls (type): Class to be inspected
+
+    Returns:
+        type: The most derived class in the chain of __base__ that adds to the
+            instance layout
+    """
+    try:
+        return _solid_bases[cls]
+    except KeyError:
+        pass
+    base = cls.__base__
+    if base is None:
+        out = cls
+    else:
+        out = solid_base(base)
+        if has_extra_layout(cls, out):
+            out = cls
+    _solid_bases[cls] = out
+    return out
+
+
+def layout_conflict(a: object, b: object) -> bool:
+    """
+    Determines if no class can inherit from both given classes.
+    Args:
+        a (object): First class, generic aliases are replaced by their origin
+        b (object): Second class, generic aliases are replaced by their origin
+
+    Returns:
+        bool: True if the instance layouts of the classes are incompatible
+    """
+    a = get_origin(a) or a
+    b = get_origin(b) or b
+    if not (isinstance(a, type) and isinstance(b, type)):
         return False
+    solid_a, solid_b = solid_base(a), solid_base(b)
+    return solid_a not in solid_b.__mro__ and solid_b not in solid_a.__mro__
+
+
+def has_layout_conflict(components: Iterable[object]) -> bool:
+    """
+    Determines if no class can inherit from all given classes, in one pass
+    like `best_base` in CPython's typeobject.c: compatible solid bases form a
+    chain, so every solid base must be in the MRO of the most derived one seen
+    so far, or have it in its own.
+    Args:
+        components (Iterable[object]): Classes, generic aliases are replaced
+            by their origin
+
+    Returns:
+        bool: True if the instance layouts of two of the classes are
+            incompatible, see layout_conflict
+    """
+    best: type | None = None
+    for i in components:
+        cls = get_origin(i) or i
+        if not isinstance(cls, type):
+            continue
+        solid = solid_base(cls)
+        if best is None or best in solid.__mro__:
+            best = solid
+        elif solid not in best.__mro__:
+            return True
+    return False
+
+
+def sort_key(tp: object) -> tuple[str, str, str, int]:
+    return (
+        str(getattr(tp, "__module__", "")),
+        str(getattr(tp, "__qualname__", "")),
+        repr(tp),
+        id(tp),
+    )
+
+
+def normalize(intersects: Sequence[object]) -> tuple[tuple[object, ...], bool]:
+    """
+    Applies the reductions of the specification to the components of an
+    intersection (which must not contain unions):
+    nested intersections are flattened, duplicates, ``Any`` and classes that
+    another component (or the origin of a generic alias) subclasses are
+    removed, and the rest is sorted.
+    Args:
+        intersects (Sequence[object]): Components of the intersection
+
+    Returns:
+        tuple[tuple[object, ...], bool]: The canonical components, and whether
+            the intersection evaluates to Never
+    """
+    never = False
+    flat: list[object] = []
+    for i in intersects:
+        if isinstance(i, Intersection):
+            never = never or i.__never__
+            nested: Sequence[object] = i.__intersects__
+        else:
+            nested = (i,)
+        for j in nested:
+            if j is NoneType:
+                j = None
+            if j not in flat:
+                flat.append(j)
+
+    components = [i for i in flat if i is not Any] or [Any]
+    # Classes some other component subclasses. Generic aliases, e.g.
+    # list[int], subclass the classes in the MRO of their origin.
+    bases = {
+        base
+        for i in components
+        for base in getattr(get_origin(i) or i, "__mro__", ())
+        if base is not i
+    }
+    components = [i for i in components if not (isinstance(i, type) and i in bases)]
+
+    if any(i is Never or i is NoReturn for i in components):
+        return (Never,), True
+    if None in components and len(components) > 1:
+        never = True
+    elif has_layout_conflict(components):
+        never = True
+
+    components.sort(key=sort_key)
+    return tuple(components), never
+
+
+# (annotations the member was looked up in, annotation, attribute) found on a
+# component, _MISSING where there is none
+Found = tuple[dict[str, Any] | None, object, object]
+
+
+def member_fingerprint(intersects: Sequence[object], name: str) -> tuple[Found, ...]:
+    """
+    Looks up the annotation and the attribute of a name on every component.
+    Annotations of classes are looked up through their MRO, like attributes.
+    Args:
+        intersects (Sequence[object]): Components of the intersection
+        name (str): The name of the attribute
+
+    Returns:
+        tuple[Found, ...]: The annotations looked up, the annotation and the
+            attribute found on every component
+    """
+    out: list[Found] = []
+    for i in intersects:
+        annotations = getattr(i, "__annotations__", None)
+        if not isinstance(annotations, dict):
+            annotations = None
+        if isinstance(i, type) and (annotations is None or name not in annotations):
+            # Inherited annotations, otherwise the component's own ones so
+            # that adding the annotation later is noticed
+            inherited = vars(defining_class(i, name, True)).get("__annotations__")
+            if isinstance(inherited, dict) and name in inherited:
+                annotations = inherited
+        out.append(
+            (
+                annotations,
+                _MISSING if annotations is None else annotations.get(name, _MISSING),
+                getattr(i, name, _MISSING),
+            )
+        )
+    return tuple(out)
+
+
+# What a resolved member depends on: (annotations, annotation) for the
+# annotations looked up on the components providing it, and (component,
+# attribute) for those only providing an attribute, see member_dependencies
+Dependencies = tuple[
+    tuple[tuple[dict[str, Any], object], ...], tuple[tuple[object, object], ...]
+]
+
+
+def member_dependencies(
+    intersects: Sequence[object], fingerprint: Sequence[Found], kinds: int
+) -> Dependencies:
+    """
+    Collects what the resolution of a member depends on, so a cached result
+    can be checked against later mutations of the components that provided
+    it: their annotation or, if not annotated, their attribute. Components
+    that don't provide the member aren't checked.
+    Args:
+        intersects (Sequence[object]): Components of the intersection
+        fingerprint (Sequence[Found]): The result of member_fingerprint
+        kinds (int): The kinds of the components as given by classify_all
+
+    Returns:
+        Dependencies: The dependencies, checked by is_current
+    """
+    annotated: list[tuple[dict[str, Any], object]] = []
+    attributes: list[tuple[object, object]] = []
+    for x, (annotations, annotation, attribute) in enumerate(fingerprint):
+        if component_kind(kinds, x) & (ANY | CALLABLE):
+            # Generic aliases can't be mutated
+            continue
+        if annotation is _MISSING and attribute is _MISSING:
+            continue
+        if annotations is not None:
+            annotated.append((annotations, annotation))
+        if annotation is _MISSING:
+            attributes.append((intersects[x], attribute))
+    return tuple(annotated), tuple(attributes)
+
+
+# Types of the attributes created anew on every lookup, e.g. of classmethods
+BOUND_METHOD_TYPES = (MethodType, BuiltinMethodType, MethodWrapperType)
+
+
+def is_current(dependencies: Dependencies, name: str) -> bool:
+    """
+    Checks the dependencies of a cached member, stopping at the first one that
+    changed. Mutating a class replaces its attributes, so they are compared by
+    identity, as they may not support == (e.g. arrays compare elementwise).
+    Only bound methods, which are created on every lookup, are compared by ==.
+    Args:
+        dependencies (Dependencies): The result of member_dependencies
+        name (str): The name of the member
+
+    Returns:
+        bool: True if none of the dependencies changed
+    """
+    annotated, attributes = dependencies
+    for annotations, annotation in annotated:
+        if annotations.get(name, _MISSING) is not annotation:
+            return False
+    for component, attribute in attributes:
+        found = getattr(component, name, _MISSING)
+        if found is not attribute and not (
+            type(found) is type(attribute)
+            and isinstance(found, BOUND_METHOD_TYPES)
+            and found == attribute
+        ):
+            return False
     return True
 
 
+def eval_forward_ref(
+    annotation: object, globalns: dict[str, Any], localns: Mapping[str, Any]
+) -> object:
+    """
+    Evaluates a string annotation, leaving it as is if it can't be evaluated
+    Args:
+        annotation (object): The annotation
+        globalns (dict[str, Any]): Globals to evaluate the annotation in
+        localns (Mapping[str, Any]): Locals to evaluate the annotation in
+
+    Returns:
+        object: The evaluated annotation, or the original one
+    """
+    if not isinstance(annotation, str):
+        return annotation
+    try:
+        return eval(annotation, globalns, localns)
+    except Exception:
+        # e.g. a class local to a function
+        return annotation
+
+
+def defining_class(component: type, name: str, annotation: bool) -> type:
+    """
+    Finds the class in the MRO of a component that defines a member.
+    Args:
+        component (type): The component the member was found on
+        name (str): The name of the member
+        annotation (bool): Look for an annotation rather than an attribute
+
+    Returns:
+        type: The first class defining the member, the component itself if
+            none does
+    """
+    for cls in component.__mro__:
+        namespace = vars(cls)
+        if annotation:
+            annotations = namespace.get("__annotations__")
+            if isinstance(annotations, dict) and name in annotations:
+                return cls
+        elif name in namespace:
+            return cls
+    return component
+
+
+def function_globals(method: Any) -> dict[str, Any] | None:
+    # Bound methods, e.g. of classmethods, carry the function as __func__, and
+    # decorated functions the original one as __wrapped__, like in
+    # typing.get_type_hints
+    method = getattr(method, "__func__", method)
+    while hasattr(method, "__wrapped__"):
+        method = method.__wrapped__
+    return getattr(method, "__globals__", None)
+
+
+def resolve_forward_refs(
+    component: object, name: str, member: Any, attribute: Any = None
+) -> Any:
+    """
+    Resolves the forward references in the annotation or the signatures of a
+    member, in the namespaces they were written in: the globals of a method,
+    or the module of the class in the MRO of the component that defines the
+    annotation, and the namespace of that class. Each (class, name) is
+    evaluated once, until the member changes.
+    Args:
+        component (object): The component the member was found on
+        name (str): The name of the member
+        member (Any): The annotation, or a tuple of the member's signatures
+        attribute (Any): The method the signatures are of
+
+    Returns:
+        Any: The member with its string annotations evaluated
+    """
+    if not isinstance(component, type):
+        return member
+    owner = defining_class(component, name, not isinstance(member, tuple))
+    cache = _forward_refs.get(owner)
+    if cache is None:
+        cache = _forward_refs[owner] = {}
+    entry = cache.get(name)
+    if entry is not None and entry[0] == member:
+        return entry[1]
+
+    globalns = function_globals(attribute)
+    if globalns is None:
+        module = sys.modules.get(owner.__module__)
+        globalns = vars(module) if module is not None else {}
+    localns = vars(owner)
+    if isinstance(member, tuple):
+        out: Any = tuple(
+            sig.replace(
+                parameters=[
+                    i.replace(
+                        annotation=eval_forward_ref(i.annotation, globalns, localns)
+                    )
+                    for i in sig.parameters.values()
+                ],
+                return_annotation=eval_forward_ref(
+                    sig.return_annotation, globalns, localns
+                ),
+            )
+            for sig in member
+        )
+    else:
+        out = eval_forward_ref(member, globalns, localns)
+    cache[name] = (member, out)
+    return out
+
+
+def resolve_member(
+    intersects: Sequence[object],
+    name: str,
+    fingerprint: Sequence[Found] | None = None,
+    kinds: int | None = None,
+) -> Any:
+    """
+    Resolves the type of an attribute of an intersection, without any caching.
+    Every component contributes: method signatures are combined into an
+    Overload, while annotations and attribute types are intersected.
+    Args:
+        intersects (Sequence[object]): Components of the intersection
+        name (str): The name of the attribute to obtain
+        fingerprint (Sequence[Found] | None): The result of
+            member_fingerprint for `name`, computed if not given
+        kinds (int | None): The kinds of the components as given by
+            classify_all, computed if not given
+
+    Returns:
+        Any: The type of the attribute, _MISSING if it was not found
+    """
+    if fingerprint is None:
+        fingerprint = member_fingerprint(intersects, name)
+    if kinds is None:
+        kinds = classify_all(intersects)[0]
+    signatures: list[Signature] = []
+    types: list[object] = []
+    for x, i in enumerate(intersects):
+        _, annotation, attribute = fingerprint[x]
+        kind = component_kind(kinds, x)
+        if kind == ANY:
+            return Any
+        elif annotation is not _MISSING:
+            types.append(resolve_forward_refs(i, name, annotation))
+        elif attribute is _MISSING:
+            pass
+        elif kind == CALLABLE:
+            if name == "__call__":
+                from intersection_examples.signatures import callable_signature
+
+                signatures.append(callable_signature(i))
+        elif callable(attribute):
+            from intersection_examples.signatures import get_signatures
+
+            try:
+                method_signatures = get_signatures(attribute)
+            except ValueError:
+                # Builtins without a text signature, e.g. __init_subclass__
+                types.append(type(attribute))
+            else:
+                signatures.extend(
+                    resolve_forward_refs(i, name, method_signatures, attribute)
+                )
+        else:
+            types.append(type(attribute))
+
+    if signatures:
+        try:
+            unique = list(dict.fromkeys(signatures))
+        except TypeError:
+            # Unhashable annotations
+            unique = []
+            for sig in signatures:
+                if sig not in unique:
+                    unique.append(sig)
+        if len(unique) == 1:
+            return unique[0]
+        from intersection_examples.signatures import Overload
+
+        return Overload(unique)
+    elif types:
+        return intersect(types)
+    return _MISSING
+
+
+def member_names(intersects: Sequence[object], with_object: bool = True) -> set[str]:
+    """
+    Collects the names of every member of the components, in a single pass
+    over the __dict__ and annotations of the classes in their MROs.
+    Args:
+        intersects (Sequence[object]): Components of the intersection
+        with_object (bool): Include the members only inherited from object
+
+    Returns:
+        set[str]: The names of all members
+    """
+    names: set[str] = set()
+    for i in intersects:
+        if is_callable(i):
+            names.add("__call__")
+            continue
+        cls = NoneType if i is None else get_origin(i) or i
+        if not isinstance(cls, type):
+            continue
+        for base in cls.__mro__:
+            if base is object and not with_object:
+                continue
+            namespace = vars(base)
+            names.update(namespace)
+            annotations = namespace.get("__annotations__")
+            if isinstance(annotations, dict):
+                names.update(annotations)
+    return names
+
+
+def type_verdict(
+    intersects: Sequence[object], cls: type
+) -> tuple[tuple[str, ...], frozenset[str]] | None:
+    """
+    Performs the part of an isinstance check against an intersection that only
+    depends on the type of the object. Nominal components are checked via the
+    MRO, structural components by the presence of their members.
+    Args:
+        intersects (Sequence[object]): Components of the intersection
+        cls (type): Type of the object to be checked
+
+    Raises:
+        TypeError: A component doesn't support instance checks
+
+    Returns:
+        tuple[tuple[str, ...], frozenset[str]] | None: None if no instance of
+            cls is of the intersection type, otherwise the attributes that are
+            still to be looked up on the instance, and the keys it must contain
+    """
+    attributes: list[str] = []
+    keys: set[str] = set()
+    for i in intersects:
+        if i is None:
+            if cls is not NoneType:
+                return None
+        elif is_typeddict(i):
+            if not issubclass(cls, dict):
+                return None
+            keys.update(cast(Any, i).__required_keys__)
+        elif is_callable(i):
+            if not issubclass(cls, cast(type, Callable)):
+                return None
+        elif is_protocol(i):  # type:ignore
+            if not getattr(i, "_is_runtime_protocol", False):
+                raise TypeError(
+                    "Instance and class checks can only be used with"
+                    " @runtime_checkable protocols"
+                )
+            for name in get_protocol_members(i):  # type:ignore
+                if not hasattr(cls, name):
+                    # Might still be set on the instance
+                    attributes.append(name)
+        elif not issubclass(cls, cast(type, get_origin(i) or i)):
+            # Generic aliases are checked against their origin, e.g. list[int]
+            # against list
+            return None
+    return tuple(dict.fromkeys(attributes)), frozenset(keys)
+
+
+def generate_validator(
+    intersects: Sequence[object], never: bool = False
+) -> Callable[[object], bool]:
+    """
+    Generates the source of a function checking if an object is of the type of
+    an intersection, with one check per component spelled out, and compiles it.
+    Args:
+        intersects (Sequence[object]): Components of the intersection
+        never (bool): The intersection evaluates to Never
+
+    Raises:
+        TypeError: A component doesn't support instance checks
+
+    Returns:
+        Callable[[object], bool]: Function equivalent to isinstance
+    """
+    namespace: dict[str, Any] = {}
+    type_checks: list[str] = ["False"] if never else []
+    member_checks: list[str] = []
+    keys: set[str] = set()
+    for x, i in enumerate(intersects):
+        if i is None:
+            type_checks.append("obj is None")
+        elif is_typeddict(i):
+            type_checks.append("isinstance(obj, dict)")
+            keys.update(cast(Any, i).__required_keys__)
+        elif is_callable(i):
+            type_checks.append("callable(obj)")
+        elif is_protocol(i):  # type:ignore
+            if not getattr(i, "_is_runtime_protocol", False):
+                raise TypeError(
+                    "Instance and class checks can only be used with"
+                    " @runtime_checkable protocols"
+                )
+            members = sorted(get_protocol_members(i))  # type:ignore
+            member_checks += [f"hasattr(obj, {k!r})" for k in members]
+        else:
+            namespace[f"t{x}"] = get_origin(i) or i
+            type_checks.append(f"isinstance(obj, t{x})")
+    if keys:
+        namespace["keys"] = frozenset(keys)
+        member_checks.append("obj.keys() >= keys")
+    checks = " and ".join(dict.fromkeys(type_checks + member_checks)) or "True"
+    exec(f"def validate(obj):\n    return {checks}\n", namespace)
+    return namespace["validate"]
+
+
+def merge_typed_dicts(typed_dicts: Sequence[object]) -> type:
+    """
+    Creates a TypedDict with the keys of all the given TypedDicts.
+    A key is required if any of them requires it. A key with a different type
+    in several of them is given the union of the types.
+    Args:
+        typed_dicts (Sequence[object]): TypedDicts to be merged
+
+    Raises:
+        TypeError: Not all of typed_dicts are TypedDicts
+
+    Returns:
+        type: The merged TypedDict
+    """
+    hints: dict[str, list[Any]] = {}
+    required: set[str] = set()
+    for i in typed_dicts:
+        if not is_typeddict(i):
+            raise TypeError(f"{i!r} is not a TypedDict")
+        for name, hint in typing_get_type_hints(i).items():
+            hints.setdefault(name, []).append(hint)
+        required.update(cast(Any, i).__required_keys__)
+    fields = {
+        name: Union[tuple(hint)]
+        if name in required
+        else NotRequired[Union[tuple(hint)]]
+        for name, hint in hints.items()
+    }
+    name = "And".join(cast(type, i).__name__ for i in typed_dicts)
+    out = cast(type, TypedDict(name, fields))  # type:ignore
+    out.__module__ = cast(type, typed_dicts[0]).__module__
+    return out
+
+
+# Members of protocols carried over to materialized classes
+MEMBER_TYPES = (FunctionType, classmethod, staticmethod, property)
+
+
+# Instructions of functions only returning None, besides loading it
+STUB_INSTRUCTIONS = frozenset({"RESUME", "NOP", "RETURN_VALUE"})
+
+
+def is_stub(member: object) -> bool:
+    """
+    Checks if a member of a protocol only declares a method, i.e. its body is
+    `...`, `pass` or a docstring, which compile to just returning None.
+    Args:
+        member (object): The member, of one of MEMBER_TYPES
+
+    Returns:
+        bool: True if the member has no implementation
+    """
+    if isinstance(member, property):
+        return all(
+            i is None or is_stub(i) for i in (member.fget, member.fset, member.fdel)
+        )
+    from dis import get_instructions
+
+    code = getattr(getattr(member, "__func__", member), "__code__", None)
+    if code is None:
+        return False
+    for i in get_instructions(code):
+        if i.opname in ("LOAD_CONST", "RETURN_CONST"):
+            if i.argval is not None:
+                return False
+        elif i.opname not in STUB_INSTRUCTIONS:
+            return False
+    return True
+
+
+def materialize_class(intersects: Sequence[object], kinds: int) -> type:
+    """
+    Creates a class subclassing the nominal components, carrying the members
+    of the structural ones. Methods of protocols are copied unless a nominal
+    component already provides them or they are stubs, see is_stub.
+    Annotations of protocols and TypedDicts are merged.
+    Args:
+        intersects (Sequence[object]): Components of the intersection
+        kinds (int): The kinds of the components as given by classify_all
+
+    Returns:
+        type: The new class
+    """
+    from inspect import getattr_static
+
+    bases: list[type] = []
+    structural: list[type] = []
+    for x, i in enumerate(intersects):
+        kind = component_kind(kinds, x)
+        if kind == NOMINAL:
+            bases.append(cast(type, get_origin(i) or i))
+        elif kind == STRUCTURAL:
+            structural.append(cast(type, i))
+
+    annotations: dict[str, Any] = {}
+    namespace: dict[str, Any] = {"__annotations__": annotations}
+    for i in structural:
+        for base in reversed(i.__mro__):
+            annotations.update(vars(base).get("__annotations__", {}))
+        if is_protocol(i):  # type:ignore
+            for name in get_protocol_members(i):  # type:ignore
+                value = getattr_static(i, name, None)
+                if (
+                    isinstance(value, MEMBER_TYPES)
+                    and not is_stub(value)
+                    and not any(hasattr(j, name) for j in bases)
+                ):
+                    namespace.setdefault(name, value)
+    name = "And".join(getattr(i, "__name__", repr(i)) for i in intersects)
+    return type(name, tuple(bases) or (object,), namespace)
+
+
+def forward_getattr(self: object, name: str) -> Any:
+    # Fallback of proxies for members missing from the wrapped class
+    return getattr(object.__getattribute__(self, "__wrapped__"), name)
+
+
+def forward_repr(self: Any) -> str:
+    return repr(self.__wrapped__)
+
+
+def forward_eq(self: Any, other: object) -> bool:
+    return self.__wrapped__ == other
+
+
+def forward_hash(self: Any) -> int:
+    return hash(self.__wrapped__)
+
+
+def forwarding_property(name: str) -> property:
+    """
+    Creates a property reading the attribute of the wrapped object of a proxy.
+    Reads go through attrgetter, so they don't run Python code, writes are
+    forwarded by make_setattr.
+    Args:
+        name (str): The name of the attribute
+
+    Returns:
+        property: The property
+    """
+    return property(attrgetter("__wrapped__." + name))
+
+
+def forwarding_method(name: str) -> Callable[..., Any]:
+    """
+    Creates a special method of proxies calling that of the wrapped object,
+    as special methods are looked up on the type, bypassing __getattr__.
+    Args:
+        name (str): The name of the special method
+
+    Returns:
+        Callable[..., Any]: The method
+    """
+
+    def method(self: Any, *args: Any, **kwargs: Any) -> Any:
+        return getattr(self.__wrapped__, name)(*args, **kwargs)
+
+    method.__name__ = method.__qualname__ = name
+    return method
+
+
+def make_setattr(slots: tuple[str, ...]) -> Callable[[Any, str, object], None]:
+    """
+    Creates the __setattr__ of proxies, setting their slots and forwarding any
+    other attribute to the wrapped object.
+    Args:
+        slots (tuple[str, ...]): The slots of the proxy class
+
+    Returns:
+        Callable[[Any, str, object], None]: The method
+    """
+    names = frozenset(slots)
+
+    def __setattr__(self: Any, name: str, value: object) -> None:
+        if name in names:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(object.__getattribute__(self, "__wrapped__"), name, value)
+
+    return __setattr__
+
+
+def make_delattr(slots: tuple[str, ...]) -> Callable[[Any, str], None]:
+    """
+    Creates the __delattr__ of proxies, the counterpart of make_setattr.
+    Args:
+        slots (tuple[str, ...]): The slots of the proxy class
+
+    Returns:
+        Callable[[Any, str], None]: The method
+    """
+    names = frozenset(slots)
+
+    def __delattr__(self: Any, name: str) -> None:
+        if name in names:
+            object.__delattr__(self, name)
+        else:
+            delattr(object.__getattribute__(self, "__wrapped__"), name)
+
+    return __delattr__
+
+
+# Special methods proxies don't forward, as they implement them or they
+# concern the class rather than its instances
+PROXY_SPECIAL_METHODS = frozenset(
+    {
+        "__class__",
+        "__class_getitem__",
+        "__delattr__",
+        "__dir__",
+        "__getattr__",
+        "__getattribute__",
+        "__getstate__",
+        "__init__",
+        "__init_subclass__",
+        "__new__",
+        "__reduce__",
+        "__reduce_ex__",
+        "__setattr__",
+        "__setstate__",
+        "__subclasshook__",
+    }
+)
+
+
+def make_proxy_class(
+    cls: type, intersects: Sequence[object], kinds: int, extras: tuple[str, ...]
+) -> tuple[type, tuple[str, ...]]:
+    """
+    Creates the class of the proxies wrapping instances of cls as an
+    intersection. The extra members are slots, the other members of cls are
+    read through properties and anything else through __getattr__, writes of
+    anything but the slots go to the wrapped object. The special methods cls
+    defines, besides those in PROXY_SPECIAL_METHODS, are forwarded along with
+    __eq__, __hash__ and __repr__, and __class__ is that of the wrapped
+    object, so the proxy can stand in for it.
+    Args:
+        cls (type): The class of the wrapped objects
+        intersects (Sequence[object]): Components of the intersection
+        kinds (int): The kinds of the components as given by classify_all
+        extras (tuple[str, ...]): The names of the extra members, sorted
+
+    Returns:
+        tuple[type, tuple[str, ...]]: The proxy class, and the names of
+            protocol members that must be checked on every wrapped object
+            since cls doesn't define them
+    """
+    slots = ("__wrapped__", *extras)
+    namespace: dict[str, Any] = {
+        "__slots__": slots,
+        "__getattr__": forward_getattr,
+        "__setattr__": make_setattr(slots),
+        "__delattr__": make_delattr(slots),
+        "__class__": property(attrgetter("__wrapped__.__class__")),
+        "__repr__": forward_repr,
+        "__eq__": forward_eq,
+        "__hash__": forward_hash,
+    }
+    for name in member_names((cls,), with_object=False):
+        if name in extras or name in namespace:
+            continue
+        if not (name.startswith("__") and name.endswith("__")):
+            namespace[name] = forwarding_property(name)
+        elif name not in PROXY_SPECIAL_METHODS and callable(getattr(cls, name, None)):
+            namespace[name] = forwarding_method(name)
+
+    unchecked: list[str] = []
+    for x, i in enumerate(intersects):
+        if is_protocol(i) and component_kind(kinds, x) == STRUCTURAL:  # type:ignore
+            for name in get_protocol_members(i):  # type:ignore
+                if name not in extras and not hasattr(cls, name):
+                    unchecked.append(name)
+    proxy = type(cls.__name__ + "Proxy", (), namespace)
+    proxy.__qualname__ = cls.__qualname__ + "Proxy"
+    return proxy, tuple(unchecked)
+
+
 # Inheritance from Any added to allow type checking to be enabled - attributes of
-# this class are unknown to the type checker.
-class Intersection(Any):
-    __intersects__: list[type[object]]
-    __dict__: Any
+# this class are unknown to the type checker. At runtime the base is object, since
+# Any instances carry a __dict__ that would defeat __slots__.
+if TYPE_CHECKING:
+    IntersectionBase = Any
+else:
+    IntersectionBase = object
 
-    def __init__(self, *intersects: type[object]) -> None:
-        self.__intersects__ = list(intersects)
 
-    def __new__(cls, *args, **kwargs) -> Self:
-        # Workaround to allow inheritance from Any
-        return super().__new__(cls)
+class Intersection(IntersectionBase):
+    __slots__ = (
+        "__intersects__",
+        "__never__",
+        "__type_hints__",
+        "__typed_dict__",
+        "__type_verdicts__",
+        "__validator__",
+        "__dispatchers__",
+        "__member_cache__",
+        "__cache_stats__",
+        "__kinds__",
+        "__kind_summary__",
+        "__materialized__",
+        "__proxies__",
+        "__weakref__",
+    )
+    __intersects__: tuple[type[object], ...]
+    __never__: bool
+
+    def __init__(self, *intersects: type[object], never: bool = False) -> None:
+        self.__intersects__ = intersects
+        self.__never__ = never
+        # See classify_all
+        self.__kinds__, self.__kind_summary__ = classify_all(intersects)
+        self.__type_hints__: dict[str, Any] | None = None
+        self.__typed_dict__: type | None = None
+        # type -> result of type_verdict, created on the first check
+        self.__type_verdicts__: WeakKeyDictionary[type, Any] | None = None
+        self.__validator__: Callable[[object], bool] | None = None
+        self.__materialized__: type | None = None
+        # The following are created on first use, as most intersections never
+        # need them
+        # (wrapped class, names of extras) -> (proxy class, unchecked members)
+        self.__proxies__: dict[tuple[type, tuple[str, ...]], Any] | None = None
+        self.__dispatchers__: dict[str, Dispatcher] | None = None
+        # name -> (dependencies, resolved member or _MISSING)
+        self.__member_cache__: dict[str, tuple[Dependencies, Any]] | None = None
+        # [hits, misses]
+        self.__cache_stats__: list[int] | None = None
 
     def __class_getitem__(cls, key):
         """
         Allows for the generation of an instance of Intersection based on
-        a series of types (the expected interface of intersection)
+        a series of types (the expected interface of intersection).
+        The types are normalized first, so the same instance is returned for
+        every equivalent series of types.
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        try:
+            out = lookup_interned((cls, *key))
+        except TypeError:
+            # Unhashable components can't be interned
+            return cls._evaluate(key)
+        if out is not None:
+            return out
+        out = cls._evaluate(key)
+        if isinstance(out, Intersection):
+            remember((cls, *key), out)
+        return out
+
+    @classmethod
+    def _evaluate(cls, key: tuple[object, ...]) -> Any:
         """
-        return cls(*key)
+        Evaluates an intersection of the given types to its canonical form.
+        Unions are distributed over the intersection, i.e. (A | B) & C becomes
+        (A & C) | (B & C), dropping the branches that evaluate to Never.
+
+        Args:
+            key (tuple[object, ...]): Components of the intersection
+
+        Raises:
+            TypeError: No types were given
+
+        Returns:
+            Any: An interned Intersection, a union of them, or a single type
+        """
+        if len(key) == 0:
+            raise TypeError("Cannot take an Intersection of no types.")
+        if any(is_union(i) for i in key):
+            alternatives = [get_args(i) if is_union(i) else (i,) for i in key]
+            branches = [cls._evaluate(i) for i in product(*alternatives)]
+            possible = [
+                i for i in branches if not (isinstance(i, Intersection) and i.__never__)
+            ]
+            return Union[tuple(possible or branches[:1])]
+
+        normalized, never = normalize(key)
+        if len(normalized) == 1:
+            # An intersection with only one element is the element itself
+            return normalized[0]
+        components = cast(tuple[type, ...], normalized)
+        try:
+            out = lookup_interned((cls, *components))
+        except TypeError:
+            return cls(*components, never=never)
+        if out is None:
+            out = cls(*components, never=never)
+            remember((cls, *components), out)
+        return out
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickled as its components, unpickling interns the intersection again
+        return getitem, (type(self), self.__intersects__)
+
+    def __eq__(self, other: object) -> bool:
+        # Instances are interned, so equal intersections are the same object
+        return self is other
+
+    def __hash__(self) -> int:
+        return object.__hash__(self)
+
+    def __instancecheck__(self, obj: object) -> bool:
+        """
+        An object is an instance of an intersection if it is an instance of all
+        its components, where structural components are checked by the presence
+        of their members. The result for the class of the object is cached.
+        """
+        if self.__never__:
+            return False
+        verdicts = self.__type_verdicts__
+        if verdicts is None:
+            verdicts = self.__type_verdicts__ = WeakKeyDictionary()
+        # Like isinstance, trusts __class__, which proxies set to the class of
+        # the wrapped object
+        cls = obj.__class__
+        try:
+            verdict = verdicts[cls]
+        except KeyError:
+            verdict = verdicts[cls] = type_verdict(self.__intersects__, cls)
+        if verdict is None:
+            return False
+        attributes, keys = verdict
+        return all(hasattr(obj, i) for i in attributes) and (
+            not keys or cast(dict, obj).keys() >= keys
+        )
+
+    def __subclasscheck__(self, cls: type) -> bool:
+        """
+        A class is a subclass of an intersection if it is a subclass of all
+        its components, where structural components are checked by the presence
+        of their members. TypedDicts don't support class checks.
+        """
+        if any(is_typeddict(i) for i in self.__intersects__):
+            raise TypeError("TypedDict does not support instance and class checks")
+        if self.__never__:
+            return False
+        verdicts = self.__type_verdicts__
+        if verdicts is None:
+            verdicts = self.__type_verdicts__ = WeakKeyDictionary()
+        try:
+            verdict = verdicts[cls]
+        except KeyError:
+            verdict = verdicts[cls] = type_verdict(self.__intersects__, cls)
+        return verdict == ((), frozenset())
 
     def __repr__(self) -> str:
         attrs = list(repr(i) for i in self.__intersects__)
-        return "Intersection[" + ", ".join(attrs) + "]"
+        return type(self).__name__ + "[" + ", ".join(attrs) + "]"
 
     def __getattribute__(self, name: str):
         """
@@ -110,57 +1376,606 @@ class Intersection(Any):
         if name in get_attribute_excludes:
             return super().__getattribute__(name)
 
-        for i in self.__intersects__:
-            if i == Any:
-                return Any
-            elif hasattr(i, "__annotations__") and name in i.__annotations__:
-                return i.__annotations__[name]
-            elif hasattr(i, name):
-                if is_callable(i):
-                    params, return_type = get_args(i)
-                    return Signature(
-                        parameters=[
-                            Parameter(name="self", kind=Parameter.POSITIONAL_ONLY)
-                        ]
-                        + [
-                            Parameter(
-                                name="param" + str(x),
-                                kind=Parameter.POSITIONAL_ONLY,
-                                annotation=i,
-                            )
-                            for x, i in enumerate(params)
-                        ],
-                        return_annotation=return_type,
-                    )
-                else:
-                    method = getattr(i, name)
-                    if callable(method):
-                        sig_funcs = [sig_func(i) for i in get_possible_methods(method)]
-                        if len(sig_funcs) == 1:
-                            return sig_funcs[0]
-                        else:
-                            return (
-                                "Overload["
-                                + ",".join([format(i) for i in sig_funcs])
-                                + "]"
-                            )
-                    else:
-                        return type(method)
-            else:
-                pass
+        get = super().__getattribute__
+        if get("__kind_summary__") & ANY:
+            return Any
+        cache = get("__member_cache__")
+        entry = cache.get(name) if cache is not None else None
+        if entry is not None and is_current(entry[0], name):
+            get("__cache_stats__")[0] += 1
+            out = entry[1]
+        else:
+            if cache is None:
+                cache = self.__member_cache__ = {}
+            stats = get("__cache_stats__")
+            if stats is None:
+                stats = self.__cache_stats__ = [0, 0]
+            stats[1] += 1
+            intersects = get("__intersects__")
+            kinds = get("__kinds__")
+            fingerprint = member_fingerprint(intersects, name)
+            out = resolve_member(intersects, name, fingerprint, kinds)
+            if out is not _MISSING and all(is_typeddict(i) for i in intersects):
+                # Keys follow the merged TypedDict, see merge_typed_dicts
+                out = get_type_hints(self).get(name, out)
+            cache[name] = (member_dependencies(intersects, fingerprint, kinds), out)
+        if out is _MISSING:
+            raise MissingMember(name=name, obj=self)
+        return out
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the statistics of the resolved-member cache
+
+        Returns:
+            CacheInfo: Hits, misses and the number of cached members
+        """
+        hits, misses = self.__cache_stats__ or (0, 0)
+        return CacheInfo(hits, misses, len(self.__member_cache__ or ()))
+
+    def cache_clear(self) -> None:
+        """
+        Clears the resolved-member cache and its statistics. Cached members
+        follow changes to the components that provide them, but a member
+        added to another component is only seen after clearing the cache.
+        """
+        self.__member_cache__ = None
+        self.__cache_stats__ = None
+
+    def resolve_all(self) -> int:
+        """
+        Resolves every member of the components into the member cache,
+        evaluating all forward references up front
+
+        Returns:
+            int: The number of members resolved
+        """
+        count = 0
+        for name in member_names(self.__intersects__):
+            try:
+                getattr(self, name)
+            except AttributeError:
+                continue
+            count += 1
+        return count
+
+    def compile_validator(self) -> Callable[[object], bool]:
+        """
+        Returns a function equivalent to isinstance(obj, self), generated for
+        the components of this intersection so that it performs no reflection
+        when called. The function is only generated once.
 
-        raise AttributeError(f"Attribute not found on type {self}")
+        Raises:
+            TypeError: A component doesn't support instance checks
+
+        Returns:
+            Callable[[object], bool]: The validator
+        """
+        if self.__validator__ is None:
+            self.__validator__ = generate_validator(self.__intersects__, self.__never__)
+        return self.__validator__
+
+    def dispatcher(self, name: str) -> "Dispatcher":
+        """
+        Returns a function to call the method of the given name on instances of
+        this intersection, dispatching to the implementation of the component
+        whose overload matches the arguments first. It is only created once.
+
+        Args:
+            name (str): The name of the method
+
+        Raises:
+            AttributeError: No class component implements the method
+
+        Returns:
+            Dispatcher: Function taking the instance and the arguments
+        """
+        dispatchers = self.__dispatchers__
+        if dispatchers is None:
+            dispatchers = self.__dispatchers__ = {}
+        if name not in dispatchers:
+            kinds = self.__kinds__
+            methods = [
+                getattr(i, name)
+                for x, i in enumerate(self.__intersects__)
+                if component_kind(kinds, x) == NOMINAL
+                and callable(getattr(i, name, None))
+            ]
+            if not methods:
+                raise AttributeError(f"Method {name} not implemented by {self}")
+            from intersection_examples.signatures import Dispatcher
+
+            dispatchers[name] = Dispatcher(name, methods)
+        return dispatchers[name]
+
+    def materialize(self) -> type:
+        """
+        Returns a class subclassing must_subclass and carrying the members of
+        the structural components, see materialize_class. It is only created
+        once per canonical intersection, so repeated calls return the same
+        class while it is alive.
+
+        Raises:
+            TypeError: The intersection evaluates to Never
+
+        Returns:
+            type: The class
+        """
+        if self.__never__:
+            raise TypeError(f"No class can subclass {self}, it evaluates to Never")
+        out = self.__materialized__
+        if out is None:
+            intersects = self.__intersects__
+            hashable = True
+            try:
+                out = _materialized.get(intersects)
+            except TypeError:
+                # Unhashable components
+                hashable = False
+            if out is None:
+                out = materialize_class(intersects, self.__kinds__)
+                if hashable:
+                    _materialized[intersects] = out
+            self.__materialized__ = out
+        return out
+
+    def wrap(self, obj: object, **extras: object) -> Any:
+        """
+        Wraps an object in a proxy adding the given members, so it can be used
+        as this intersection. The proxy class is generated once per class of
+        the wrapped object and names of the extras, see make_proxy_class.
+
+        Args:
+            obj (object): The object to be wrapped
+            **extras (object): Values of the members added by the proxy
+
+        Raises:
+            TypeError: The object isn't an instance of the nominal components,
+                or a member of a protocol is neither on it nor in the extras
+
+        Returns:
+            Any: The proxy
+        """
+        if self.__never__:
+            raise TypeError(f"No object can be of type {self}, it evaluates to Never")
+        cls = type(obj)
+        names = tuple(sorted(extras))
+        proxies = self.__proxies__
+        if proxies is None:
+            proxies = self.__proxies__ = {}
+        try:
+            proxy, unchecked = proxies[(cls, names)]
+        except KeyError:
+            for i in self.must_subclass:
+                if not isinstance(obj, cast(type, get_origin(i) or i)):
+                    raise TypeError(f"{obj!r} is not an instance of {i!r}") from None
+            proxy, unchecked = proxies[(cls, names)] = make_proxy_class(
+                cls, self.__intersects__, self.__kinds__, names
+            )
+        for name in unchecked:
+            if not hasattr(obj, name):
+                raise TypeError(f"{obj!r} has no member {name} required by {self}")
+        out = object.__new__(proxy)
+        out.__wrapped__ = obj
+        for name, value in extras.items():
+            setattr(out, name, value)
+        return out
 
     @property
     def must_subclass(self) -> tuple[object, ...]:
         """
         Returns the classes that this intersection must subclass
 
+        Raises:
+            TypeError: The intersection evaluates to Never
+
         Returns:
             tuple[object,...]: Classes that must be subclassed in this order
         """
-        out = []
-        for i in self.__intersects__:
-            if is_non_structural(i):
-                out.append(i)
-        return tuple(out)
+        if self.__never__:
+            raise TypeError(f"No class can subclass {self}, it evaluates to Never")
+        kinds = self.__kinds__
+        return tuple(
+            i
+            for x, i in enumerate(self.__intersects__)
+            if component_kind(kinds, x) == NOMINAL
+        )
+
+    @property
+    def typed_dict(self) -> type:
+        """
+        Returns the TypedDict equivalent to this intersection of TypedDicts,
+        see merge_typed_dicts. It is only created once.
+
+        Raises:
+            TypeError: Not all components are TypedDicts
+
+        Returns:
+            type: The merged TypedDict
+        """
+        if self.__typed_dict__ is None:
+            self.__typed_dict__ = merge_typed_dicts(self.__intersects__)
+        return self.__typed_dict__
+
+    @property
+    def is_never(self) -> bool:
+        """
+        Returns whether no object can be of this intersection type, e.g. because
+        it intersects None or classes with conflicting instance layouts.
+
+        Returns:
+            bool: True if the intersection evaluates to Never
+        """
+        return self.__never__
+
+
+def intersect(types: Sequence[object]) -> Any:
+    """
+    Evaluates the intersection of the given types, i.e. Intersection[types]
+    Args:
+        types (Sequence[object]): Components of the intersection
+
+    Returns:
+        Any: An interned Intersection, a union of them, or a single type
+    """
+    return Intersection.__class_getitem__(tuple(types))
+
+
+# Members every class inherits, left out of the table of EagerIntersection
+OBJECT_MEMBERS = frozenset(vars(object))
+
+
+class EagerIntersection(Intersection):
+    """
+    An Intersection whose members are all resolved on creation into a frozen
+    table, trading the detection of later mutations of its components for
+    lookups that never probe them again.
+    Only members found in the namespaces of the components are resolved.
+    Members the components only inherit from object aren't part of the table,
+    they are resolved lazily like in an Intersection.
+    """
+
+    __slots__ = ("__members__",)
+
+    def __init__(self, *intersects: type[object], never: bool = False) -> None:
+        super().__init__(*intersects, never=never)
+        members: dict[str, Any] = {}
+        for name in member_names(intersects, with_object=False):
+            out = resolve_member(intersects, name)
+            if out is not _MISSING:
+                members[name] = out
+        if all(is_typeddict(i) for i in intersects):
+            members.update(get_type_hints(self))
+        self.__members__: Mapping[str, Any] = MappingProxyType(members)
+
+    def __getattribute__(self, name: str):
+        if name in get_attribute_excludes:
+            return super().__getattribute__(name)
+
+        get = super().__getattribute__
+        stats = get("__cache_stats__")
+        if stats is None:
+            stats = self.__cache_stats__ = [0, 0]
+        try:
+            out = get("__members__")[name]
+        except KeyError:
+            if name in OBJECT_MEMBERS:
+                return super().__getattribute__(name)
+            stats[1] += 1
+            raise MissingMember(name=name, obj=self) from None
+        stats[0] += 1
+        return out
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the statistics of the frozen member table
+
+        Returns:
+            CacheInfo: Hits, misses and the number of members in the table
+        """
+        hits, misses = self.__cache_stats__ or (0, 0)
+        return CacheInfo(hits, misses, len(self.__members__))
+
+
+def get_type_hints(obj: object) -> dict[str, Any]:
+    """
+    Returns the type hints of an intersection, i.e. the merged type hints of
+    all its components with forward references resolved. A name annotated by
+    several components is given the intersection of their hints, except for
+    intersections of TypedDicts, see merge_typed_dicts.
+    The hints are computed once per intersection.
+    Other objects are passed on to typing.get_type_hints.
+    Args:
+        obj (object): Intersection, or anything accepted by typing.get_type_hints
+
+    Returns:
+        dict[str, Any]: Mapping of names to their type hints
+    """
+    if not isinstance(obj, Intersection):
+        return typing_get_type_hints(obj)
+    hints = obj.__type_hints__
+    if hints is None:
+        if all(is_typeddict(i) for i in obj.__intersects__):
+            hints = typing_get_type_hints(obj.typed_dict)
+        else:
+            merged: dict[str, list[Any]] = {}
+            for i in obj.__intersects__:
+                if isinstance(i, type):
+                    for name, hint in typing_get_type_hints(i).items():
+                        merged.setdefault(name, []).append(hint)
+            hints = {name: intersect(i) for name, i in merged.items()}
+        obj.__type_hints__ = hints
+    return dict(hints)
+
+
+def get_validator(intersection: object) -> Callable[[object], bool]:
+    """
+    Returns a function checking if an object is of the given type.
+    Args:
+        intersection (object): Intersection, or any other argument of isinstance
+
+    Returns:
+        Callable[[object], bool]: The compiled validator of an intersection,
+            isinstance otherwise
+    """
+    if isinstance(intersection, Intersection):
+        return intersection.compile_validator()
+    return lambda obj: isinstance(obj, cast(Any, intersection))
+
+
+# Validator of the intersection given to init_worker, in worker processes
+_worker_validator: Callable[[object], bool] | None = None
+
+
+def init_worker(intersection: object) -> None:
+    global _worker_validator
+    _worker_validator = get_validator(intersection)
+
+
+def validate_chunk(chunk: list[object]) -> list[bool]:
+    return list(map(cast(Callable[[object], bool], _worker_validator), chunk))
+
+
+def validate_in_processes(
+    intersection: object, chunks: Iterator[list[object]], workers: int | None
+) -> Iterator[list[bool]]:
+    """
+    Validates chunks of objects in a pool of processes. The intersection is
+    pickled once for each process, then the chunks are streamed to them, with
+    at most two chunks per process waiting to be validated or consumed.
+    Args:
+        intersection (object): Intersection, or any other argument of isinstance
+        chunks (Iterator[list[object]]): Objects to be validated
+        workers (int | None): Number of processes, defaults to the CPU count
+
+    Yields:
+        list[bool]: Whether each object of a chunk is valid, in order
+    """
+    # Imported here, as it is only needed for parallel validation
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(
+        workers, initializer=init_worker, initargs=(intersection,)
+    )
+    pending: deque[Future[list[bool]]] = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(validate_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def validate_stream(
+    intersection: object,
+    iterable: Iterable[object],
+    chunk_size: int = 1024,
+    fail_fast: bool = False,
+    parallel: bool = False,
+    workers: int | None = None,
+) -> Iterator[bool]:
+    """
+    Lazily checks if each object of an iterable is of the type of an
+    intersection, with the compiled validator of the intersection. Objects are
+    validated one by one, or sent to a pool of processes in chunks, so at most
+    chunk_size objects per process are held at once.
+    Args:
+        intersection (object): Intersection, or any other argument of isinstance
+        iterable (Iterable[object]): Objects to be validated
+        chunk_size (int): Number of objects sent to a process at once
+        fail_fast (bool): Stop after the first invalid object. Without
+            parallel, no object after it is taken from iterable
+        parallel (bool): Validate the chunks in a pool of processes, see
+            validate_in_processes
+        workers (int | None): Number of processes, defaults to the CPU count
+
+    Raises:
+        ValueError: chunk_size is not positive
+
+    Yields:
+        bool: Whether each object is valid, in the order of iterable
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    # Raises for invalid intersections before any process is started
+    validate = get_validator(intersection)
+    iterator = iter(iterable)
+    if not parallel:
+        for valid in map(validate, iterator):
+            yield valid
+            if fail_fast and not valid:
+                return
+        return
+    chunks = iter(lambda: list(islice(iterator, chunk_size)), [])
+    for results in validate_in_processes(intersection, chunks, workers):
+        if fail_fast and False in results:
+            yield from results[: results.index(False) + 1]
+            return
+        yield from results
+
+
+# Intersection -> operation -> [calls, seconds], while instrumentation is enabled
+_instrumented: "WeakKeyDictionary[Intersection, dict[str, list[float]]]" = (
+    WeakKeyDictionary()
+)
+# [calls, seconds] of get_possible_methods
+_possible_methods_stats = [0, 0.0]
+# (owner, name) -> attribute replaced by enable_instrumentation
+_uninstrumented: dict[tuple[Any, str], Any] = {}
+
+
+def record(intersection: Intersection, operation: str, seconds: float) -> None:
+    stats = _instrumented.get(intersection)
+    if stats is None:
+        stats = _instrumented[intersection] = {}
+    entry = stats.get(operation)
+    if entry is None:
+        stats[operation] = [1, seconds]
+    else:
+        entry[0] += 1
+        entry[1] += seconds
+
+
+def instrument_getattribute(original: Callable[[Any, str], Any]) -> Callable:
+    def __getattribute__(self: Any, name: str) -> Any:
+        if name in get_attribute_excludes:
+            return original(self, name)
+        start = perf_counter()
+        try:
+            return original(self, name)
+        finally:
+            record(self, "getattr", perf_counter() - start)
+
+    return __getattribute__
+
+
+def instrument_must_subclass(original: property) -> property:
+    def must_subclass(self: Any) -> tuple[object, ...]:
+        start = perf_counter()
+        try:
+            return cast(Callable, original.fget)(self)
+        finally:
+            record(self, "must_subclass", perf_counter() - start)
+
+    return property(must_subclass, doc=original.__doc__)
+
+
+def instrument_possible_methods(
+    original: Callable[[Callable], Sequence[Callable]]
+) -> Callable[[Callable], Sequence[Callable]]:
+    def get_possible_methods(method: Callable) -> Sequence[Callable]:
+        start = perf_counter()
+        try:
+            return original(method)
+        finally:
+            _possible_methods_stats[0] += 1
+            _possible_methods_stats[1] += perf_counter() - start
+
+    return get_possible_methods
+
+
+def enable_instrumentation() -> None:
+    """
+    Starts recording the calls to __getattribute__ and must_subclass of every
+    intersection and to get_possible_methods, with the time spent in them.
+    The instrumented functions replace the plain ones until
+    disable_instrumentation is called, so there is no cost while disabled.
+    """
+    if _uninstrumented:
+        return
+    classes = [Intersection, *Intersection.__subclasses__()]
+    for cls in classes:
+        if "__getattribute__" in vars(cls):
+            original = vars(cls)["__getattribute__"]
+            _uninstrumented[(cls, "__getattribute__")] = original
+            setattr(cls, "__getattribute__", instrument_getattribute(original))
+    original = vars(Intersection)["must_subclass"]
+    _uninstrumented[(Intersection, "must_subclass")] = original
+    setattr(Intersection, "must_subclass", instrument_must_subclass(original))
+    from intersection_examples import signatures
+
+    original = signatures.get_possible_methods
+    _uninstrumented[(signatures, "get_possible_methods")] = original
+    setattr(signatures, "get_possible_methods", instrument_possible_methods(original))
+
+
+def disable_instrumentation() -> None:
+    """
+    Restores the plain functions replaced by enable_instrumentation. The
+    recorded statistics are kept until reset_instrumentation is called.
+    """
+    for (owner, name), original in _uninstrumented.items():
+        setattr(owner, name, original)
+    _uninstrumented.clear()
+
+
+def instrumentation_enabled() -> bool:
+    return bool(_uninstrumented)
+
+
+def reset_instrumentation() -> None:
+    """
+    Discards the statistics recorded so far
+    """
+    _instrumented.clear()
+    _possible_methods_stats[:] = [0, 0.0]
+
+
+def cache_size(intersection: Intersection) -> int:
+    """
+    Approximates the memory held by the member cache of an intersection
+    Args:
+        intersection (Intersection): The intersection
+
+    Returns:
+        int: Size in bytes of the cache and its entries, without the members
+    """
+    cache = intersection.__member_cache__
+    if cache is None:
+        return 0
+    out = sys.getsizeof(cache)
+    for entry in cache.values():
+        out += sys.getsizeof(entry) + sys.getsizeof(entry[0])
+    return out
+
+
+def instrumentation_snapshot() -> dict[str, Any]:
+    """
+    Returns the statistics recorded while instrumentation was enabled, with
+    the state of the member cache of every recorded intersection
+
+    Returns:
+        dict[str, Any]: Plain data keyed on the repr of the intersections, e.g.
+            {"enabled": True,
+             "get_possible_methods": {"calls": 2, "seconds": 1e-05},
+             "intersections": {"Intersection[...]": {
+                "getattr": {"calls": 3, "seconds": 5e-05},
+                "cache": {"hits": 2, "misses": 1, "hit_ratio": 0.67,
+                          "currsize": 1, "bytes": 312}}}}
+    """
+    intersections: dict[str, Any] = {}
+    for intersection, stats in list(_instrumented.items()):
+        info = intersection.cache_info()
+        lookups = info.hits + info.misses
+        out: dict[str, Any] = {
+            operation: {"calls": int(calls), "seconds": seconds}
+            for operation, (calls, seconds) in stats.items()
+        }
+        out["cache"] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_ratio": info.hits / lookups if lookups else 0.0,
+            "currsize": info.currsize,
+            "bytes": cache_size(intersection),
+        }
+        intersections[repr(intersection)] = out
+    calls, seconds = _possible_methods_stats
+    return {
+        "enabled": instrumentation_enabled(),
+        "get_possible_methods": {"calls": int(calls), "seconds": seconds},
+        "intersections": intersections,
+    }
@@ -0,0 +1,427 @@
+"""
+Signatures of the members of intersections: overload sets, their runtime
+dispatch, and the cache of the signatures of methods. Imported on first use,
+since inspect is slow to import.
+"""
+from abc import ABCMeta
+from collections import OrderedDict
+from inspect import Parameter, Signature, signature as sig_func
+from math import inf
+from types import MethodType, UnionType
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+    cast,
+    get_args,
+    get_overloads,
+    is_typeddict,
+)
+from weakref import ref
+
+from intersection_examples import CacheInfo
+
+
+def annotation_matches(value: object, annotation: object) -> bool:
+    """
+    Checks a value against an annotation where that is possible at runtime.
+    Args:
+        value (object): The value
+        annotation (object): The annotation of the parameter it is passed to
+
+    Returns:
+        bool: False only if the value is known not to be of the annotated type
+    """
+    if annotation in (Any, Parameter.empty):
+        return True
+    if not isinstance(annotation, (type, UnionType)):
+        return True
+    try:
+        return isinstance(value, annotation)
+    except TypeError:
+        # e.g. protocols that aren't runtime checkable
+        return True
+
+
+def signature_matches(
+    signature: Signature, args: tuple[object, ...], kwargs: dict[str, object]
+) -> bool:
+    """
+    Checks if a call with the given arguments matches a signature, i.e. the
+    arguments can be bound and are instances of the annotated classes. Every
+    argument collected by *args or **kwargs is checked against its annotation.
+    Args:
+        signature (Signature): The signature
+        args (tuple[object, ...]): Positional arguments of the call
+        kwargs (dict[str, object]): Keyword arguments of the call
+
+    Returns:
+        bool: True if the call matches
+    """
+    try:
+        bound = signature.bind(*args, **kwargs)
+    except TypeError:
+        return False
+    parameters = signature.parameters
+    for name, value in bound.arguments.items():
+        parameter = parameters[name]
+        if parameter.kind is Parameter.VAR_POSITIONAL:
+            values: Iterable[object] = cast(tuple, value)
+        elif parameter.kind is Parameter.VAR_KEYWORD:
+            values = cast(dict, value).values()
+        else:
+            values = (value,)
+        for i in values:
+            if not annotation_matches(i, parameter.annotation):
+                return False
+    return True
+
+
+class Overload:
+    """
+    An immutable set of overloaded signatures.
+    For calls with positional arguments only, the signatures accepting each
+    number of arguments are indexed by the class annotated on the first
+    parameter in which they differ, so select only checks few candidates.
+    """
+
+    __slots__ = ("signatures", "_by_arity", "_variadic", "_hash")
+
+    signatures: tuple[Signature, ...]
+    # arity -> (dispatch position or None, class -> candidates, other candidates)
+    _by_arity: dict[
+        int, tuple[int | None, dict[type, tuple[int, ...]], tuple[int, ...]]
+    ]
+    # Candidates for numbers of arguments not in _by_arity
+    _variadic: tuple[int, ...]
+    _hash: int | None
+
+    def __init__(self, signatures: Iterable[Signature]) -> None:
+        set_attr = super().__setattr__
+        set_attr("signatures", tuple(signatures))
+        try:
+            set_attr("_hash", hash(self.signatures))
+        except TypeError:
+            # Annotations aren't hashable
+            set_attr("_hash", None)
+
+        # Range of the number of positional arguments each signature accepts,
+        # None if it requires keyword arguments
+        ranges: list[tuple[int, float] | None] = []
+        for signature in self.signatures:
+            parameters = signature.parameters.values()
+            if any(
+                i.kind is Parameter.KEYWORD_ONLY and i.default is i.empty
+                for i in parameters
+            ):
+                ranges.append(None)
+                continue
+            positional = [
+                i
+                for i in parameters
+                if i.kind
+                in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+            ]
+            minimum = sum(1 for i in positional if i.default is i.empty)
+            if any(i.kind is Parameter.VAR_POSITIONAL for i in parameters):
+                ranges.append((minimum, inf))
+            else:
+                ranges.append((minimum, len(positional)))
+
+        # Greater numbers of arguments are only accepted by variadic signatures
+        limit = max(
+            [0] + [i[0] if i[1] == inf else int(i[1]) for i in ranges if i is not None]
+        )
+        by_arity = {}
+        for arity in range(limit + 1):
+            candidates = tuple(
+                x
+                for x, i in enumerate(ranges)
+                if i is not None and i[0] <= arity <= i[1]
+            )
+            by_arity[arity] = self._index(candidates, arity)
+        set_attr("_by_arity", by_arity)
+        set_attr(
+            "_variadic",
+            tuple(x for x, i in enumerate(ranges) if i is not None and i[1] == inf),
+        )
+
+    def _index(
+        self, candidates: tuple[int, ...], arity: int
+    ) -> tuple[int | None, dict[type, tuple[int, ...]], tuple[int, ...]]:
+        """
+        Indexes candidates by the class annotated on the first of the arity
+        positional parameters in which their annotations differ.
+        """
+        for position in range(arity):
+            annotations = [
+                positional_annotation(self.signatures[i], position) for i in candidates
+            ]
+            if any(i != annotations[0] for i in annotations):
+                break
+        else:
+            return None, {}, candidates
+        by_class: dict[type, tuple[int, ...]] = {}
+        other: list[int] = []
+        for i, annotation in zip(candidates, annotations):
+            # Classes whose instances are found via the MRO of the argument
+            if (
+                isinstance(annotation, type)
+                and not isinstance(annotation, ABCMeta)
+                and not is_typeddict(annotation)
+                and annotation not in (Any, Parameter.empty)
+            ):
+                by_class[annotation] = by_class.get(annotation, ()) + (i,)
+            else:
+                other.append(i)
+        return position, by_class, tuple(other)
+
+    def candidates(self, args: tuple[object, ...]) -> tuple[int, ...]:
+        """
+        Returns the indices of the signatures that might match a call with
+        the given positional arguments, in order.
+        """
+        entry = self._by_arity.get(len(args))
+        if entry is None:
+            return self._variadic
+        position, by_class, other = entry
+        if position is None:
+            return other
+        found = list(other)
+        for i in type(args[position]).__mro__:
+            found.extend(by_class.get(i, ()))
+        return tuple(sorted(found))
+
+    def match(self, *args: object, **kwargs: object) -> int:
+        """
+        Finds the first signature matching a call with the given arguments,
+        see signature_matches.
+
+        Raises:
+            TypeError: No signature matches the call
+
+        Returns:
+            int: Index of the matching signature
+        """
+        if kwargs:
+            candidates: Iterable[int] = range(len(self.signatures))
+        else:
+            candidates = self.candidates(args)
+        for i in candidates:
+            if signature_matches(self.signatures[i], args, kwargs):
+                return i
+        raise TypeError(f"No overload of {self} matches the arguments")
+
+    def select(self, *args: object, **kwargs: object) -> Signature:
+        """
+        Selects the first signature matching a call with the given arguments,
+        see signature_matches.
+
+        Raises:
+            TypeError: No signature matches the call
+
+        Returns:
+            Signature: The matching signature
+        """
+        return self.signatures[self.match(*args, **kwargs)]
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("Overload is immutable")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return Overload, (self.signatures,)
+
+    def __iter__(self) -> Iterator[Signature]:
+        return iter(self.signatures)
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Overload):
+            return NotImplemented
+        return self.signatures == other.signatures
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            raise TypeError(f"unhashable annotations in {self}")
+        return self._hash
+
+    def __repr__(self) -> str:
+        return "Overload[" + ",".join([format(i) for i in self.signatures]) + "]"
+
+
+def positional_annotation(signature: Signature, position: int) -> object:
+    """
+    Returns the annotation of the parameter receiving the positional argument
+    at the given position, Parameter.empty if there is none.
+    """
+    parameters = list(signature.parameters.values())
+    for i in parameters[: position + 1]:
+        if i.kind is Parameter.VAR_POSITIONAL:
+            return i.annotation
+    if position < len(parameters) and parameters[position].kind in (
+        Parameter.POSITIONAL_ONLY,
+        Parameter.POSITIONAL_OR_KEYWORD,
+    ):
+        return parameters[position].annotation
+    return Parameter.empty
+
+
+class Dispatcher:
+    """
+    Calls the implementation, among methods of several classes, whose
+    signature (or one of its overloads) matches the arguments. For calls with
+    positional arguments only, the implementation is cached per tuple of
+    argument types, so repeated calls skip matching the signatures.
+    """
+
+    __slots__ = ("name", "overload", "implementations", "cache")
+
+    name: str
+    overload: Overload
+    implementations: tuple[Callable, ...]
+    # Types of the arguments -> implementation, None if there is none
+    cache: dict[tuple[type, ...], Callable | None]
+
+    def __init__(self, name: str, methods: Sequence[Callable]) -> None:
+        signatures: list[Signature] = []
+        implementations: list[Callable] = []
+        for method in methods:
+            for signature in get_signatures(method):
+                signatures.append(signature)
+                implementations.append(method)
+        self.name = name
+        self.overload = Overload(signatures)
+        self.implementations = tuple(implementations)
+        self.cache = {}
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if kwargs:
+            implementation = self.implementations[self.overload.match(*args, **kwargs)]
+            return implementation(*args, **kwargs)
+        key = tuple(map(type, args))
+        try:
+            cached = self.cache[key]
+        except KeyError:
+            try:
+                cached = self.implementations[self.overload.match(*args)]
+            except TypeError:
+                cached = None
+            self.cache[key] = cached
+        if cached is None:
+            raise TypeError(f"No implementation of {self.name} matches the arguments")
+        return cached(*args)
+
+    def __get__(self, obj: object, owner: type | None = None) -> Any:
+        # Binds like a function when set as a class attribute
+        return self if obj is None else MethodType(self, obj)
+
+    def __repr__(self) -> str:
+        return f"Dispatcher[{self.name}: {self.overload}]"
+
+
+# Maximum number of methods in the cache of get_signatures
+SIGNATURE_CACHE_SIZE = 4096
+
+# (id(method), whether it is bound) -> (weak reference to the method, or the
+# method itself if it can't be weakly referenced, and its signatures). Bound
+# methods are keyed on their function, as they are created on every lookup.
+# Least recently used first.
+_signatures: OrderedDict[
+    tuple[int, bool], tuple[Any, tuple[Signature, ...]]
+] = OrderedDict()
+# [hits, misses]
+_signature_stats = [0, 0]
+
+
+def get_possible_methods(method: Callable) -> Sequence[Callable]:
+    # Overloads are registered by module and qualified name, which wrappers
+    # like functools.lru_cache copy, asking for the overloads of objects
+    # without them raises AttributeError
+    func = getattr(method, "__func__", method)
+    if isinstance(getattr(func, "__module__", None), str) and isinstance(
+        getattr(func, "__qualname__", None), str
+    ):
+        overloads = get_overloads(method)
+        if overloads:
+            return overloads
+    return [method]
+
+
+def get_signatures(method: Callable) -> tuple[Signature, ...]:
+    """
+    Returns the signatures of the overloads of a method, or the signature of
+    the method itself if it isn't overloaded. The signatures of the
+    SIGNATURE_CACHE_SIZE most recently used methods are cached, only holding
+    weak references to the methods where possible. Bound methods, e.g. of
+    classmethods, are cached by their function.
+    Args:
+        method (Callable): The method
+
+    Returns:
+        tuple[Signature, ...]: The signatures, in order of definition
+    """
+    target = getattr(method, "__func__", method)
+    key = (id(target), target is not method)
+    entry = _signatures.get(key)
+    if entry is not None:
+        cached = entry[0]() if isinstance(entry[0], ref) else entry[0]
+        if cached is target:
+            _signatures.move_to_end(key)
+            _signature_stats[0] += 1
+            return entry[1]
+
+    _signature_stats[1] += 1
+    signatures = tuple(sig_func(i) for i in get_possible_methods(method))
+
+    def forget(reference: ref) -> None:
+        if _signatures.get(key, (None,))[0] is reference:
+            del _signatures[key]
+
+    try:
+        reference: Any = ref(target, forget)
+    except TypeError:
+        # e.g. methods of builtin types, which are kept alive by their type anyway
+        reference = target
+    _signatures[key] = (reference, signatures)
+    if len(_signatures) > SIGNATURE_CACHE_SIZE:
+        _signatures.popitem(last=False)
+    return signatures
+
+
+def signature_cache_info() -> CacheInfo:
+    """
+    Returns the statistics of the cache of get_signatures
+
+    Returns:
+        CacheInfo: Hits, misses and the number of cached methods
+    """
+    hits, misses = _signature_stats
+    return CacheInfo(hits, misses, len(_signatures))
+
+
+def callable_signature(component: object) -> Signature:
+    """
+    Builds the signature of `__call__` described by a Callable alias
+    Args:
+        component (object): The Callable alias, e.g. Callable[[int], str]
+
+    Returns:
+        Signature: A method signature taking self and the alias' parameters
+    """
+    params, return_type = get_args(component)
+    return Signature(
+        parameters=[Parameter(name="self", kind=Parameter.POSITIONAL_ONLY)]
+        + [
+            Parameter(
+                name="param" + str(x),
+                kind=Parameter.POSITIONAL_ONLY,
+                annotation=i,
+            )
+            for x, i in enumerate(params)
+        ],
+        return_annotation=return_type,
+    )
@@ -0,0 +1,400 @@
+"""
+Checks the expectations of the mypy_test_*.py files with a single mypy run.
+
+The expectations are the `# E:` (error), `# W:` (warning), `# N:` (note) and
+`# R:` (revealed type) comments in the functions marked with
+pytest.mark.mypy_testing. All files are checked by one call of mypy.api with
+an incremental cache, so a warm run only re-checks the files that changed.
+The diagnostics are then mapped back to the marked functions.
+
+With several jobs or checkers, the files are split into shards checked in a
+pool of processes, each shard with its own cache, see run_sharded.
+
+Under pytest, test_mypy_runner.py checks the expectations with the mypy of
+the current interpreter, replacing the pytest-mypy-testing plugin.
+
+Usage:
+    python tests/mypy_runner.py [--cache-dir DIR] [--jobs N]
+        [--checker NAME=COMMAND ...] [FILE ...]
+"""
+import argparse
+import ast
+import contextlib
+import io
+import os
+import re
+import shlex
+import site
+import subprocess
+import sys
+import tokenize
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, NamedTuple, Sequence
+
+TESTS = Path(__file__).resolve().parent
+ROOT = TESTS.parent
+CONFIG_FILE = TESTS / "mypy.ini"
+CACHE_DIR = ROOT / ".mypy_cache" / "expectations"
+
+SEVERITIES = {"E": "error", "W": "warning", "N": "note", "R": "note"}
+EXPECTATION = re.compile(r"#\s*(?P<kind>[EWNR]):\s*(?P<message>.*?)\s*$")
+DIAGNOSTIC = re.compile(
+    r"^(?P<path>.+?):(?P<line>\d+):(?:\d+:)? (?P<severity>error|warning|note):"
+    r" (?P<message>.*?)(?:  \[[\w-]+\])?$"
+)
+
+
+class Message(NamedTuple):
+    path: Path
+    line: int
+    severity: str
+    message: str
+
+
+class Case(NamedTuple):
+    """A function marked with pytest.mark.mypy_testing"""
+
+    path: Path
+    name: str
+    start: int
+    end: int
+    expected: tuple[Message, ...]
+    # line -> first line of the innermost statement containing it
+    statements: dict[int, int]
+
+    @property
+    def id(self) -> str:
+        return f"{self.path.name}::{self.name}"
+
+
+class Result(NamedTuple):
+    case: Case
+    missing: tuple[Message, ...]
+    unexpected: tuple[Message, ...]
+    checker: str = "mypy"
+
+    @property
+    def passed(self) -> bool:
+        return not self.missing and not self.unexpected
+
+
+class Checker(NamedTuple):
+    name: str
+    # Command running the checker, None for mypy.api in the current interpreter
+    command: tuple[str, ...] | None = None
+
+
+DEFAULT_CHECKERS = (Checker("mypy"),)
+
+
+def default_paths() -> list[Path]:
+    return sorted(TESTS.glob("mypy_test_*.py"))
+
+
+def statement_starts(tree: ast.AST) -> dict[int, int]:
+    """
+    Maps every line to the first line of the innermost statement containing
+    it. Only the header of compound statements is considered part of them, so
+    a message about a class is matched to a comment after its bases.
+    """
+    out: dict[int, int] = {}
+    # ast.walk visits parents before their children
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.stmt):
+            continue
+        body = getattr(node, "body", None)
+        if isinstance(body, list) and body:
+            end = body[0].lineno - 1
+        else:
+            end = node.end_lineno or node.lineno
+        for line in range(node.lineno, max(end, node.lineno) + 1):
+            out[line] = node.lineno
+    return out
+
+
+def parse_expectations(path: Path, source: str) -> dict[int, list[Message]]:
+    out: dict[int, list[Message]] = {}
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        if token.type != tokenize.COMMENT:
+            continue
+        match = EXPECTATION.match(token.string)
+        if match is None:
+            continue
+        kind, message = match["kind"], match["message"]
+        if kind == "R":
+            message = f'Revealed type is "{message}"'
+        line = token.start[0]
+        out.setdefault(line, []).append(Message(path, line, SEVERITIES[kind], message))
+    return out
+
+
+def is_mypy_testing(decorator: ast.expr) -> bool:
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    return ast.unparse(decorator).endswith("mark.mypy_testing")
+
+
+def collect_cases(paths: Iterable[Path]) -> list[Case]:
+    """
+    Finds the functions marked with pytest.mark.mypy_testing in the given
+    files, with the expectations in their comments.
+    """
+    cases = []
+    for path in paths:
+        path = path.resolve()
+        source = path.read_text()
+        tree = ast.parse(source, str(path))
+        expectations = parse_expectations(path, source)
+        statements = statement_starts(tree)
+        for node in tree.body:
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            if not any(is_mypy_testing(i) for i in node.decorator_list):
+                continue
+            start = node.decorator_list[0].lineno
+            end = node.end_lineno or node.lineno
+            expected = tuple(
+                message
+                for line in range(start, end + 1)
+                for message in expectations.get(line, ())
+            )
+            cases.append(Case(path, node.name, start, end, expected, statements))
+    return cases
+
+
+def mypy_args(paths: Sequence[Path], cache_dir: Path) -> list[str]:
+    return [
+        "--config-file",
+        str(CONFIG_FILE),
+        "--cache-dir",
+        str(cache_dir),
+        "--check-untyped-defs",
+        "--show-absolute-path",
+        "--no-pretty",
+        "--no-color-output",
+        "--no-error-summary",
+        *(str(i) for i in paths),
+    ]
+
+
+def run_mypy(paths: Sequence[Path], cache_dir: Path = CACHE_DIR) -> str:
+    """
+    Type checks all the given files with a single call of mypy.api, from the
+    root of the repository so intersection_examples can be imported.
+
+    Raises:
+        RuntimeError: mypy failed without checking the files
+
+    Returns:
+        str: The report of mypy
+    """
+    from mypy import api
+
+    with contextlib.chdir(ROOT):
+        stdout, stderr, status = api.run(mypy_args(paths, cache_dir))
+    if status not in (0, 1):
+        raise RuntimeError(stderr or stdout)
+    return stdout
+
+
+def parse_output(output: str) -> list[Message]:
+    # Paths are relative to the root, where the checkers run
+    out = []
+    for line in output.splitlines():
+        match = DIAGNOSTIC.match(line)
+        if match is not None:
+            out.append(
+                Message(
+                    (ROOT / match["path"]).resolve(),
+                    int(match["line"]),
+                    match["severity"],
+                    match["message"],
+                )
+            )
+    return out
+
+
+def check(cases: Iterable[Case], diagnostics: Iterable[Message]) -> list[Result]:
+    """
+    Matches the diagnostics to the expectations of the cases they are in. A
+    diagnostic satisfies an expectation with the same severity and message on
+    its line, or anywhere in the same statement. Diagnostics outside of the
+    cases are ignored.
+    """
+    by_path: dict[Path, list[Message]] = {}
+    for i in diagnostics:
+        by_path.setdefault(i.path, []).append(i)
+
+    results = []
+    for case in cases:
+        missing = list(case.expected)
+        unexpected = []
+        for found in by_path.get(case.path, ()):
+            if not case.start <= found.line <= case.end:
+                continue
+            statement = case.statements.get(found.line)
+            for expected in missing:
+                if (
+                    expected.severity == found.severity
+                    and expected.message == found.message
+                    and (
+                        expected.line == found.line
+                        or statement is not None
+                        and case.statements.get(expected.line) == statement
+                    )
+                ):
+                    missing.remove(expected)
+                    break
+            else:
+                unexpected.append(found)
+        results.append(Result(case, tuple(missing), tuple(unexpected)))
+    return results
+
+
+def run(paths: Sequence[Path], cache_dir: Path = CACHE_DIR) -> list[Result]:
+    return check(collect_cases(paths), parse_output(run_mypy(paths, cache_dir)))
+
+
+def run_checker(checker: Checker, paths: Sequence[Path], cache_dir: Path) -> str:
+    """
+    Type checks the given files in one run of the checker.
+
+    Raises:
+        RuntimeError: The checker failed without checking the files
+
+    Returns:
+        str: The report of the checker
+    """
+    if checker.command is None:
+        return run_mypy(paths, cache_dir)
+    completed = subprocess.run(
+        [*checker.command, *mypy_args(paths, cache_dir)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode not in (0, 1):
+        raise RuntimeError(completed.stderr or completed.stdout)
+    return completed.stdout
+
+
+def check_shard(
+    checker: Checker, paths: Sequence[Path], cache_dir: Path
+) -> list[Message]:
+    return parse_output(run_checker(checker, paths, cache_dir))
+
+
+def shard(paths: Iterable[Path], count: int) -> dict[int, list[Path]]:
+    """
+    Balances the paths over count shards by size: from the largest file down,
+    ties broken by path, each file goes to the shard with the fewest bytes so
+    far. The assignment only depends on the files, not the order they are
+    given in. Empty shards are left out.
+    """
+    files = sorted({i.resolve() for i in paths})
+    sizes = {i: i.stat().st_size for i in files}
+    loads = [0] * count
+    out: dict[int, list[Path]] = {}
+    for path in sorted(files, key=lambda i: -sizes[i]):
+        x = loads.index(min(loads))
+        loads[x] += sizes[path]
+        out.setdefault(x, []).append(path)
+    return {x: sorted(out[x]) for x in sorted(out)}
+
+
+def shard_cache_dir(cache_dir: Path, files: Sequence[Path]) -> Path:
+    """
+    Returns the cache directory of a shard, named after its files so a shard
+    keeps its cache across runs as long as it is given the same files.
+    """
+    key = zlib.crc32("\n".join(str(i) for i in sorted(files)).encode())
+    return cache_dir / f"shard-{key:08x}"
+
+
+def run_sharded(
+    paths: Sequence[Path],
+    checkers: Sequence[Checker] = DEFAULT_CHECKERS,
+    workers: int | None = None,
+    cache_dir: Path = CACHE_DIR,
+) -> list[Result]:
+    """
+    Checks the expectations with every checker, running each checker on
+    shards of the files in a pool of processes. Each shard has its own cache
+    directory per checker, see shard_cache_dir. The results are in the order of the checkers, then
+    of the cases, whatever order the shards complete in.
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = shard(paths, workers)
+    cases = collect_cases(paths)
+    results: list[Result] = []
+    # The workers import this module from the tests directory
+    with ProcessPoolExecutor(
+        min(workers, len(shards) * len(checkers)) or 1,
+        initializer=site.addsitedir,
+        initargs=(str(TESTS),),
+    ) as pool:
+        futures: dict[tuple[Checker, int], Future[list[Message]]] = {
+            (checker, x): pool.submit(
+                check_shard,
+                checker,
+                files,
+                shard_cache_dir(cache_dir / checker.name, files),
+            )
+            for checker in checkers
+            for x, files in shards.items()
+        }
+        for checker in checkers:
+            diagnostics = [
+                message for x in shards for message in futures[(checker, x)].result()
+            ]
+            results.extend(
+                i._replace(checker=checker.name) for i in check(cases, diagnostics)
+            )
+    return results
+
+
+def parse_checker(value: str) -> Checker:
+    name, _, command = value.partition("=")
+    return Checker(name, tuple(shlex.split(command)) if command else None)
+
+
+def report(result: Result) -> str:
+    lines = [
+        f"{'PASS' if result.passed else 'FAIL'} {result.case.id} [{result.checker}]"
+    ]
+    for i in result.missing:
+        lines.append(f"  missing    {i.line}: {i.severity}: {i.message}")
+    for i in result.unexpected:
+        lines.append(f"  unexpected {i.line}: {i.severity}: {i.message}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("paths", nargs="*", type=Path)
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR)
+    parser.add_argument("--jobs", type=int, default=1, help="0 for one per CPU")
+    parser.add_argument(
+        "--checker",
+        action="append",
+        type=parse_checker,
+        help="NAME=COMMAND, e.g. basedmypy='/path/to/python -m mypy'",
+    )
+    args = parser.parse_args(argv)
+
+    paths = args.paths or default_paths()
+    if args.jobs == 1 and not args.checker:
+        results = run(paths, args.cache_dir)
+    else:
+        results = run_sharded(
+            paths, args.checker or DEFAULT_CHECKERS, args.jobs, args.cache_dir
+        )
+    for i in results:
+        print(report(i))
+    return 0 if all(i.passed for i in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
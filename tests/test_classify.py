@@ -0,0 +1,86 @@
+from typing import Any, Callable, Protocol, TypedDict, overload
+
+from intersection_examples import (
+    ANY,
+    CALLABLE,
+    NOMINAL,
+    STRUCTURAL,
+    Intersection,
+    classify,
+    classify_all,
+    component_kind,
+    get_possible_methods,
+    is_callable,
+)
+
+
+class A:
+    a: int
+
+
+class P(Protocol):
+    def foo(self) -> int:
+        ...
+
+
+class TD(TypedDict):
+    x: int
+
+
+def test_classify():
+    assert classify(A) == NOMINAL
+    assert classify(int) == NOMINAL
+    assert classify(P) == STRUCTURAL
+    assert classify(TD) == STRUCTURAL
+    assert classify(Callable[[int], int]) == CALLABLE
+    assert classify(Any) == ANY
+
+
+def test_classify_all():
+    intersects = (A, P, Callable[[int], int], int)
+    kinds, summary = classify_all(intersects)
+    assert [component_kind(kinds, x) for x in range(len(intersects))] == [
+        NOMINAL,
+        STRUCTURAL,
+        CALLABLE,
+        NOMINAL,
+    ]
+    assert summary == NOMINAL | STRUCTURAL | CALLABLE
+
+
+def test_must_subclass_uses_kinds():
+    AP = Intersection[A, P, Callable[[int], int]]
+    assert AP.must_subclass == (A,)
+    assert AP.__kind_summary__ == NOMINAL | STRUCTURAL | CALLABLE
+
+
+def test_any_component_short_circuits():
+    # Normalization drops Any, so build the intersection directly
+    anything = Intersection(A, Any)
+    assert anything.a is Any
+    assert anything.missing is Any
+
+
+def test_predicates_on_builtins():
+    assert not is_callable(None)
+    assert not is_callable(list[int])
+    assert is_callable(Callable[..., int])
+    assert get_possible_methods(int.__add__) == [int.__add__]
+    assert get_possible_methods(len) == [len]
+
+
+def test_overloads_found():
+    class C:
+        @overload
+        def foo(self, x: int) -> int:
+            ...
+
+        @overload
+        def foo(self, x: str) -> str:
+            ...
+
+        def foo(self, x):
+            ...
+
+    assert len(get_possible_methods(C.foo)) == 2
+    assert len(get_possible_methods(C().foo)) == 2
@@ -0,0 +1,76 @@
+from typing import Protocol, overload
+
+import pytest
+
+from intersection_examples import Intersection
+
+
+class A:
+    def foo(self, x: str) -> str:
+        return "A"
+
+
+class B:
+    @overload
+    def foo(self, x: int) -> int:
+        ...
+
+    @overload
+    def foo(self, x: bytes) -> bytes:
+        ...
+
+    def foo(self, x: int | bytes) -> int | bytes:
+        return x
+
+
+class C(A, B):
+    pass
+
+
+def test_dispatch():
+    foo = Intersection[A, B].dispatcher("foo")
+    c = C()
+    assert foo(c, "x") == "A"
+    assert foo(c, 1) == 1
+    assert foo(c, b"x") == b"x"
+    assert foo(c, x=2) == 2
+    with pytest.raises(TypeError):
+        foo(c, 1.0)
+
+
+def test_cached_per_argument_types():
+    AB = Intersection[A, B]
+    foo = AB.dispatcher("foo")
+    foo.cache.clear()
+    c = C()
+    foo(c, 1)
+    foo(c, 2)
+    foo(c, "x")
+    with pytest.raises(TypeError):
+        foo(c, 1.0)
+    with pytest.raises(TypeError):
+        foo(c, 2.0)
+    assert foo.cache == {
+        (C, int): B.foo,
+        (C, str): A.foo,
+        (C, float): None,
+    }
+    assert AB.dispatcher("foo") is foo
+
+
+def test_as_method():
+    class D(C):
+        foo = Intersection[A, B].dispatcher("foo")
+
+    assert D().foo(b"y") == b"y"
+
+
+def test_structural_components_are_skipped():
+    class P(Protocol):
+        def foo(self, x: float) -> float:
+            ...
+
+    foo = Intersection[A, P].dispatcher("foo")
+    assert foo(C(), "x") == "A"
+    with pytest.raises(AttributeError):
+        Intersection[A, P].dispatcher("bar")
@@ -0,0 +1,80 @@
+from inspect import signature
+
+import pytest
+
+from intersection_examples import CacheInfo, EagerIntersection, Intersection, Overload
+
+
+class A:
+    a: int
+
+    def foo(self, x: str) -> str:
+        ...
+
+
+class B:
+    b = "b"
+
+    def foo(self, x: int) -> int:
+        ...
+
+
+def test_members_resolved_on_creation():
+    AB = EagerIntersection[A, B]
+    lazy = Intersection[A, B]
+
+    assert AB is not lazy
+    assert AB is EagerIntersection[B, A]
+    assert AB.a is int
+    assert AB.b is str
+    assert isinstance(AB.foo, Overload)
+    assert AB.foo == lazy.foo
+    assert AB.cache_info() == CacheInfo(
+        hits=4, misses=0, currsize=AB.cache_info().currsize
+    )
+
+
+def test_missing_member():
+    AB = EagerIntersection[A, B]
+
+    with pytest.raises(AttributeError):
+        AB.missing
+    assert AB.cache_info().misses == 1
+
+
+def test_table_is_frozen():
+    class C:
+        def foo(self, x: str) -> str:
+            ...
+
+    class D:
+        pass
+
+    CD = EagerIntersection[C, D]
+    before = signature(C.foo)
+
+    def foo(self, x: int) -> int:
+        ...
+
+    C.foo = foo
+    assert CD.foo == before != signature(foo)
+    with pytest.raises(TypeError):
+        CD.__members__["bar"] = int
+
+
+def test_slots():
+    assert Intersection.__dictoffset__ == 0
+    assert EagerIntersection.__dictoffset__ == 0
+
+
+def test_object_members_are_resolved_lazily():
+    AB = EagerIntersection[A, B]
+    lazy = Intersection[A, B]
+
+    assert AB.cache_info().currsize == len(
+        {"__annotations__", "__dict__", "__doc__", "__module__", "__weakref__"}
+        | {"a", "b", "foo"}
+    )
+    assert AB.__init__ == lazy.__init__
+    assert AB.__repr__ == lazy.__repr__
+    assert AB.__init__ is AB.__init__
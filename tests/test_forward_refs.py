@@ -0,0 +1,113 @@
+import builtins
+import sys
+import typing
+from inspect import signature
+from types import ModuleType
+
+import intersection_examples
+from intersection_examples import Intersection
+
+
+class A:
+    a: "int | None"
+
+    def foo(self, x: "A") -> "A":
+        ...
+
+
+class B:
+    b: "Missing"  # noqa: F821
+
+    def bar(self, x: "B") -> "list[B]":
+        ...
+
+
+def test_annotation_resolved():
+    AB = Intersection[A, B]
+    assert AB.a == int | None
+    assert AB.b == "Missing"
+
+
+def test_signature_resolved():
+    AB = Intersection[A, B]
+    assert AB.foo.parameters["x"].annotation is A
+    assert AB.foo.return_annotation is A
+    assert AB.bar.return_annotation == list[B]
+    assert signature(A.foo).return_annotation == "A"
+
+
+def test_evaluated_once(monkeypatch):
+    class C:
+        c: int
+
+    calls = []
+
+    def counting_eval(*args):
+        calls.append(args[0])
+        return builtins.eval(*args)
+
+    intersection_examples.clear_caches()
+    monkeypatch.setattr(intersection_examples, "eval", counting_eval, raising=False)
+    AC = Intersection[A, C]
+    AC.a
+    Intersection[A, int].a
+    assert calls == ["int | None"]
+
+
+def test_resolve_all(monkeypatch):
+    class C:
+        c: int
+
+    AC = Intersection[A, C]
+    assert AC.resolve_all() == len(
+        [i for i in intersection_examples.member_names((A, C)) if hasattr(AC, i)]
+    )
+    monkeypatch.setattr(intersection_examples, "eval", None, raising=False)
+    assert AC.foo.return_annotation is A
+    assert AC.a == int | None
+
+
+def make_module(monkeypatch, name, source, **namespace):
+    module = ModuleType(name)
+    module.__dict__.update(namespace)
+    monkeypatch.setitem(sys.modules, name, module)
+    exec(source, vars(module))
+    return module
+
+
+def test_namespace_of_defining_class(monkeypatch):
+    base = make_module(
+        monkeypatch,
+        "forward_refs_base",
+        """
+class Foo:
+    pass
+
+
+class Base:
+    def method(self, x: "Foo") -> "Foo":
+        ...
+""",
+    )
+    derived = make_module(
+        monkeypatch,
+        "forward_refs_derived",
+        """
+class Foo:
+    pass
+
+
+class Derived(Base):
+    pass
+""",
+        Base=base.Base,
+    )
+
+    class C:
+        pass
+
+    DC = Intersection[derived.Derived, C]
+    hints = typing.get_type_hints(derived.Derived.method)
+    assert hints["x"] is hints["return"] is base.Foo
+    assert DC.method.parameters["x"].annotation is base.Foo
+    assert DC.method.return_annotation is base.Foo
@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time of intersection_examples in microseconds, once typing
+# is already imported and the bytecode is cached
+IMPORT_BUDGET_US = 10_000
+
+# Only imported on first use of the machinery that needs them
+LAZY_MODULES = ("inspect", "typing_extensions", "intersection_examples.signatures")
+
+
+def import_times(tmp_path: Path) -> dict[str, int]:
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(ROOT),
+        "PYTHONPYCACHEPREFIX": str(tmp_path),
+    }
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import typing, intersection_examples",
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    out = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        out[name.strip()] = int(cumulative)
+    return out
+
+
+def test_heavy_modules_not_imported(tmp_path):
+    imported = import_times(tmp_path)
+    assert "intersection_examples" in imported
+    for name in LAZY_MODULES:
+        assert name not in imported
+
+
+def test_import_time_budget(tmp_path):
+    # The first run caches the bytecode
+    import_times(tmp_path)
+    best = min(import_times(tmp_path)["intersection_examples"] for _ in range(3))
+    assert best < IMPORT_BUDGET_US
@@ -0,0 +1,87 @@
+import pytest
+
+import intersection_examples
+from intersection_examples import (
+    EagerIntersection,
+    Intersection,
+    disable_instrumentation,
+    enable_instrumentation,
+    instrumentation_enabled,
+    instrumentation_snapshot,
+    reset_instrumentation,
+)
+
+
+class A:
+    a: int
+
+    def foo(self, x: int) -> int:
+        ...
+
+
+class B:
+    def foo(self, x: str) -> str:
+        ...
+
+
+@pytest.fixture
+def instrumentation():
+    reset_instrumentation()
+    enable_instrumentation()
+    yield
+    disable_instrumentation()
+    reset_instrumentation()
+
+
+def test_switch_replaces_functions():
+    getattribute = Intersection.__getattribute__
+    enable_instrumentation()
+    assert instrumentation_enabled()
+    assert Intersection.__getattribute__ is not getattribute
+    disable_instrumentation()
+    assert not instrumentation_enabled()
+    assert Intersection.__getattribute__ is getattribute
+
+
+def test_counts_calls(instrumentation):
+    AB = Intersection[A, B]
+    AB.cache_clear()
+    AB.foo
+    AB.foo
+    AB.a
+    AB.must_subclass
+    stats = instrumentation_snapshot()["intersections"][repr(AB)]
+    assert stats["getattr"]["calls"] == 3
+    assert stats["getattr"]["seconds"] > 0
+    assert stats["must_subclass"]["calls"] == 1
+    assert stats["cache"]["hits"] == 1
+    assert stats["cache"]["misses"] == 2
+    assert stats["cache"]["hit_ratio"] == pytest.approx(1 / 3)
+    assert stats["cache"]["bytes"] > 0
+
+
+def test_possible_methods_counted(instrumentation):
+    class C:
+        def bar(self) -> None:
+            ...
+
+    intersection_examples.clear_caches()
+    Intersection[A, C].bar
+    assert instrumentation_snapshot()["get_possible_methods"]["calls"] >= 1
+
+
+def test_eager_intersections(instrumentation):
+    AB = EagerIntersection[A, B]
+    AB.foo
+    stats = instrumentation_snapshot()["intersections"][repr(AB)]
+    assert stats["getattr"]["calls"] == 1
+
+
+def test_nothing_recorded_when_disabled():
+    reset_instrumentation()
+    Intersection[A, B].foo
+    assert instrumentation_snapshot() == {
+        "enabled": False,
+        "get_possible_methods": {"calls": 0, "seconds": 0.0},
+        "intersections": {},
+    }
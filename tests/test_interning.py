@@ -0,0 +1,90 @@
+import gc
+import weakref
+from typing import Callable
+
+import intersection_examples
+from intersection_examples import Intersection, clear_caches
+
+
+def test_same_instance():
+    class A:
+        pass
+
+    class B:
+        pass
+
+    assert Intersection[A, B] is Intersection[A, B]
+    assert Intersection[A, B] == Intersection[A, B]
+    assert (
+        Intersection[Callable[[int], str], A] is Intersection[Callable[[int], str], A]
+    )
+
+
+def test_dict_key():
+    class A:
+        pass
+
+    class B:
+        pass
+
+    AB = Intersection[A, B]
+    lookup = {AB: "ab"}
+    assert lookup[Intersection[A, B]] == "ab"
+
+
+def test_state_is_shared():
+    class A:
+        a: int
+
+    class B:
+        pass
+
+    AB = Intersection[A, B]
+    AB.a
+    assert Intersection[A, B].cache_info().misses == 1
+
+
+def test_components_can_be_collected():
+    class A:
+        pass
+
+    class B:
+        pass
+
+    AB = Intersection[A, B]
+    ref = weakref.ref(A)
+    del A, AB
+    # Releases the recently used intersections
+    clear_caches()
+    gc.collect()
+    assert ref() is None
+
+
+def test_state_survives_without_reference():
+    class A:
+        a: int
+
+    class B:
+        pass
+
+    for _ in range(3):
+        Intersection[A, B].a
+        gc.collect()
+    assert Intersection[A, B].cache_info().hits == 2
+
+
+def test_recently_used_are_bounded(monkeypatch):
+    clear_caches()
+    monkeypatch.setattr(intersection_examples, "INTERN_CACHE_SIZE", 2)
+
+    class A:
+        pass
+
+    refs = []
+    for _ in range(3):
+        B = type("B", (), {})
+        # In canonical order, so the intersection is remembered under one key
+        refs.append(weakref.ref(Intersection[B, A]))
+    del B
+    gc.collect()
+    assert [i() is None for i in refs] == [True, False, False]
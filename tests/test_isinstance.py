@@ -0,0 +1,135 @@
+from typing import Callable, Protocol, TypedDict, runtime_checkable
+
+import pytest
+
+from intersection_examples import Intersection
+
+
+class A:
+    pass
+
+
+class B:
+    pass
+
+
+class C(A, B):
+    pass
+
+
+@runtime_checkable
+class HasName(Protocol):
+    name: str
+
+    def greet(self) -> str:
+        ...
+
+
+class Movie(TypedDict):
+    name: str
+    year: int
+
+
+def test_nominal():
+    assert isinstance(C(), Intersection[A, B])
+    assert not isinstance(A(), Intersection[A, B])
+    assert issubclass(C, Intersection[A, B])
+    assert not issubclass(B, Intersection[A, B])
+
+
+def test_protocol():
+    class Greeter(A):
+        def __init__(self) -> None:
+            self.name = "name"
+
+        def greet(self) -> str:
+            return self.name
+
+    class Mute(A):
+        name = "name"
+
+    assert isinstance(Greeter(), Intersection[A, HasName])
+    assert not isinstance(Mute(), Intersection[A, HasName])
+    assert not issubclass(Greeter, Intersection[A, HasName])
+
+
+def test_protocol_not_runtime_checkable():
+    class P(Protocol):
+        a: int
+
+    with pytest.raises(TypeError):
+        isinstance(C(), Intersection[A, P])
+
+
+def test_callable():
+    class Call(A):
+        def __call__(self) -> None:
+            ...
+
+    assert isinstance(Call(), Intersection[A, Callable[[], None]])
+    assert not isinstance(A(), Intersection[A, Callable[[], None]])
+
+
+def test_typed_dict():
+    class Based(TypedDict):
+        based_on: str
+
+    MovieBook = Intersection[Movie, Based]
+    assert isinstance({"name": "Name", "year": 1, "based_on": "Book"}, MovieBook)
+    assert not isinstance({"name": "Name", "year": 1}, MovieBook)
+    assert not isinstance(["name", "year", "based_on"], MovieBook)
+    with pytest.raises(TypeError):
+        issubclass(dict, MovieBook)
+
+
+def test_never():
+    assert not isinstance(1, Intersection[int, str])
+
+
+def test_generic_alias():
+    class Named(list):
+        name = "Name"
+
+        def greet(self) -> str:
+            return self.name
+
+    LN = Intersection[list[int], HasName]
+    assert isinstance(Named(), LN)
+    assert not isinstance([], LN)
+    assert issubclass(Named, LN)
+
+
+def test_verdict_is_cached():
+    class D(A):
+        pass
+
+    class E(D, B):
+        pass
+
+    DB = Intersection[D, B]
+    for _ in range(3):
+        isinstance(E(), DB)
+    assert list(DB.__type_verdicts__.items()) == [(E, ((), frozenset()))]
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [C(), A(), None, len, {"name": "Name", "year": 1}, {"name": "Name"}, []],
+)
+@pytest.mark.parametrize(
+    "intersection",
+    [
+        Intersection[A, B],
+        Intersection[A, HasName],
+        Intersection[Movie, Intersection[A, B]],
+        Intersection[Movie, HasName],
+        Intersection[A, Callable[[], None]],
+        Intersection[A, None],
+        Intersection[int, str],
+        Intersection[list[int], HasName],
+    ],
+)
+def test_compiled_validator(obj, intersection):
+    validate = intersection.compile_validator()
+    assert validate(obj) == isinstance(obj, intersection)
+    assert intersection.compile_validator() is validate
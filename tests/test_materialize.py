@@ -0,0 +1,98 @@
+import gc
+import weakref
+from typing import Protocol, TypedDict, runtime_checkable
+
+import pytest
+
+from intersection_examples import Intersection, clear_caches
+
+
+class A:
+    def randomiser(self) -> float:
+        return 0.5
+
+
+@runtime_checkable
+class Named(Protocol):
+    name: str
+
+    def greet(self) -> str:
+        return "Hi " + self.name
+
+
+class Movie(TypedDict):
+    year: int
+
+
+def test_subclasses_nominal_components():
+    cls = Intersection[str, A].materialize()
+    assert issubclass(cls, str) and issubclass(cls, A)
+    assert cls("abc").randomiser() == 0.5
+
+
+def test_carries_structural_members():
+    AN = Intersection[A, Named]
+    cls = AN.materialize()
+    assert cls.__annotations__ == {"name": str}
+    obj = cls()
+    obj.name = "obj"
+    assert obj.greet() == "Hi obj"
+    assert isinstance(obj, AN)
+
+
+def test_nominal_members_win():
+    class B:
+        def greet(self) -> str:
+            return "B"
+
+    cls = Intersection[B, Named].materialize()
+    assert cls().greet() == "B"
+
+
+def test_stubs_are_not_copied():
+    class Greeter(Protocol):
+        def greet(self) -> str:
+            ...
+
+        def wave(self) -> None:
+            """Waves"""
+
+        @property
+        def mood(self) -> str:
+            ...
+
+        def polite(self) -> str:
+            return "Hello"
+
+    cls = Intersection[A, Greeter].materialize()
+    assert not hasattr(cls, "greet")
+    assert not hasattr(cls, "wave")
+    assert not hasattr(cls, "mood")
+    assert cls().polite() == "Hello"
+
+
+def test_structural_only():
+    cls = Intersection[Named, Movie].materialize()
+    assert cls.__bases__ == (object,)
+    assert cls.__annotations__ == {"name": str, "year": int}
+
+
+def test_cached():
+    AN = Intersection[A, Named]
+    assert AN.materialize() is AN.materialize()
+
+
+def test_cached_without_reference():
+    cls = Intersection[A, Named].materialize()
+    assert Intersection[A, Named].materialize() is cls
+    ref = weakref.ref(Intersection[A, Named])
+    # Releases the intersection itself
+    clear_caches()
+    gc.collect()
+    assert ref() is None
+    assert Intersection[Named, A].materialize() is cls
+
+
+def test_never():
+    with pytest.raises(TypeError):
+        Intersection[int, str].materialize()
@@ -0,0 +1,144 @@
+from inspect import signature
+
+import pytest
+
+from intersection_examples import CacheInfo, Intersection
+
+
+def test_repeated_access_hits_cache():
+    class A:
+        a: int
+
+        def foo(self, x: str) -> str:
+            ...
+
+    class B:
+        b: str
+
+    AB = Intersection[A, B]
+
+    assert AB.foo == signature(A.foo)
+    assert AB.foo is AB.foo
+    assert AB.a is int
+    assert AB.cache_info() == CacheInfo(hits=2, misses=2, currsize=2)
+
+
+def test_missing_attribute_is_cached():
+    class A:
+        pass
+
+    class B:
+        pass
+
+    AB = Intersection[A, B]
+
+    for _ in range(3):
+        with pytest.raises(AttributeError):
+            AB.missing
+    assert AB.cache_info() == CacheInfo(hits=2, misses=1, currsize=1)
+
+
+def test_mutated_component_invalidates():
+    class A:
+        def foo(self, x: str) -> str:
+            ...
+
+    class B:
+        pass
+
+    AB = Intersection[A, B]
+
+    with pytest.raises(AttributeError):
+        AB.bar
+    assert AB.foo == signature(A.foo)
+
+    def foo(self, x: int) -> int:
+        ...
+
+    A.foo = foo
+    B.bar = 1
+    assert AB.foo == signature(foo)
+    # B didn't provide bar, so adding it is only seen after clearing the cache
+    with pytest.raises(AttributeError):
+        AB.bar
+    AB.cache_clear()
+    assert AB.bar is int
+
+    B.__annotations__["bar"] = bool
+    assert AB.bar is bool
+    assert AB.cache_info().hits == 0
+
+
+def test_inherited_annotation():
+    class Base:
+        x: int
+
+    class A(Base):
+        pass
+
+    class B:
+        x: float
+
+    AB = Intersection[A, B]
+
+    assert AB.x == Intersection[int, float]
+    assert AB.x is AB.x
+    assert AB.cache_info().hits == 2
+    Base.__annotations__["x"] = bool
+    assert AB.x == Intersection[bool, float]
+
+
+def test_cache_clear():
+    class A:
+        a: int
+
+    class B:
+        pass
+
+    AB = Intersection[A, B]
+    AB.a
+    AB.a
+    AB.cache_clear()
+    assert AB.cache_info() == CacheInfo(hits=0, misses=0, currsize=0)
+
+
+def test_attributes_are_compared_by_identity():
+    class Array:
+        # Like numpy arrays, == is elementwise and the result has no truth value
+        def __eq__(self, other):
+            raise ValueError("The truth value of an array is ambiguous")
+
+        __hash__ = None
+
+    class A:
+        values = Array()
+
+        @classmethod
+        def make(cls) -> "A":
+            ...
+
+    class B:
+        pass
+
+    AB = Intersection[A, B]
+    assert AB.values is Array
+    A.values = Array()
+    assert AB.values is Array
+    assert AB.make == signature(A.make)
+    assert AB.make == signature(A.make)
+    assert AB.cache_info().hits == 1
+
+
+def test_caches_are_created_on_first_use():
+    class A:
+        a: int
+
+    class B:
+        pass
+
+    AB = Intersection[A, B]
+    for name in ("__member_cache__", "__proxies__", "__dispatchers__"):
+        assert getattr(AB, name) is None
+    assert AB.cache_info() == CacheInfo(hits=0, misses=0, currsize=0)
+    AB.a
+    assert AB.cache_info() == CacheInfo(hits=0, misses=1, currsize=1)
@@ -0,0 +1,76 @@
+from inspect import signature
+
+import pytest
+
+from intersection_examples import Intersection, Overload
+
+
+def test_methods_merge_into_overload():
+    class A:
+        def foo(self, x: str) -> str:
+            ...
+
+    class B:
+        def foo(self, x: int) -> int:
+            ...
+
+    foo = Intersection[A, B].foo
+    assert isinstance(foo, Overload)
+    assert set(foo) == {signature(A.foo), signature(B.foo)}
+    assert Intersection[B, A].foo == foo
+
+
+def test_shared_method_is_not_duplicated():
+    class Base:
+        def foo(self, x: str) -> str:
+            ...
+
+    class A(Base):
+        pass
+
+    class B(Base):
+        pass
+
+    assert Intersection[A, B].foo == signature(Base.foo)
+    assert Intersection[A, B].__repr__ == signature(object.__repr__)
+
+
+def test_unhashable_annotations_are_not_duplicated():
+    def foo(self, x: [int]) -> None:
+        ...
+
+    A = type("A", (), {"foo": foo})
+    B = type("B", (), {"foo": foo})
+    C = type("C", (), {"foo": lambda self, x: None})
+
+    assert Intersection[A, B].foo == signature(foo)
+    assert len(Intersection[A, B, C].foo) == 2
+
+
+def test_annotations_are_narrowed():
+    class A:
+        x: int
+
+    class B:
+        x: bool
+
+    class C:
+        x = 1
+
+    assert Intersection[A, B].x is Intersection[int, bool]
+    assert Intersection[A, C].x is int
+
+
+def test_member_only_on_one_component():
+    class A:
+        a: str
+
+    class B:
+        def foo(self) -> None:
+            ...
+
+    AB = Intersection[A, B]
+    assert AB.a is str
+    assert AB.foo == signature(B.foo)
+    with pytest.raises(AttributeError):
+        AB.missing
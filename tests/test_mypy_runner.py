@@ -0,0 +1,178 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from mypy_runner import (
+    TESTS,
+    Checker,
+    Message,
+    check,
+    collect_cases,
+    default_paths,
+    parse_checker,
+    parse_output,
+    report,
+    run_sharded,
+    shard,
+    shard_cache_dir,
+)
+
+CASES = collect_cases(default_paths())
+
+
+def get_case(name: str):
+    return next(i for i in CASES if i.name == name)
+
+
+def test_collect_cases():
+    assert [i.name for i in CASES[:3]] == [
+        "test_function_args",
+        "test_int_and_str",
+        "test_differing_methods",
+    ]
+    case = get_case("test_function_args")
+    assert [i.line for i in case.expected] == [27, 28, 29]
+    assert case.expected[0].severity == "error"
+    assert case.expected[0].message == (
+        'Argument 1 to "func" has incompatible type "A"; expected "A & B"'
+    )
+
+
+def test_parse_output(tmp_path):
+    path = tmp_path / "mypy_test_x.py"
+    output = (
+        f'{path}:3: error: Name "x" is not defined  [name-defined]\n'
+        f'{path}:4:5: note: Revealed type is "builtins.int"\n'
+        "Success: no issues found in 1 source file\n"
+    )
+    assert parse_output(output) == [
+        Message(path, 3, "error", 'Name "x" is not defined'),
+        Message(path, 4, "note", 'Revealed type is "builtins.int"'),
+    ]
+
+
+def test_diagnostics_mapped_to_statements():
+    case = get_case("test_differing_methods")
+    expected = case.expected[0]
+    # Reported on the first line of the class statement, expected after the bases
+    found = expected._replace(line=expected.line - 2)
+    (result,) = check([case], [found])
+    assert result.passed
+
+
+def test_missing_and_unexpected():
+    case = get_case("test_function_args")
+    unexpected = case.expected[0]._replace(line=case.start + 2, message="Other")
+    (result,) = check([case], [*case.expected[1:], unexpected])
+    assert not result.passed
+    assert result.missing == case.expected[:1]
+    assert result.unexpected == (unexpected,)
+    assert report(result).startswith("FAIL mypy_test_basic.py::test_function_args")
+
+
+def test_diagnostics_outside_cases_ignored():
+    case = get_case("test_function_args")
+    outside = case.expected[0]._replace(line=1)
+    (result,) = check([case], [*case.expected, outside])
+    assert result.passed
+
+
+def test_shard(tmp_path):
+    sizes = {"a": 50, "b": 40, "c": 30, "d": 30, "e": 20, "f": 10, "g": 10}
+    paths = []
+    for name, size in sizes.items():
+        path = tmp_path / f"mypy_test_{name}.py"
+        path.write_text("#" * size)
+        paths.append(path)
+    shards = shard(paths, 3)
+    assert sorted(i for files in shards.values() for i in files) == sorted(paths)
+    assert all(files == sorted(files) for files in shards.values())
+    assert shard(reversed(paths), 3) == shards
+    # Largest first into the lightest shard: a, f, g | b, e | c, d
+    loads = sorted(sum(i.stat().st_size for i in files) for files in shards.values())
+    assert loads == [60, 60, 70]
+    assert list(shard(paths[:2], 3)) == [0, 1]
+
+
+def test_shard_cache_dir(tmp_path):
+    paths = [tmp_path / f"mypy_test_{i}.py" for i in "abc"]
+    key = shard_cache_dir(tmp_path, paths)
+    assert key.parent == tmp_path
+    assert shard_cache_dir(tmp_path, paths[::-1]) == key
+    assert shard_cache_dir(tmp_path, paths[1:]) != key
+
+
+def test_parse_checker():
+    assert parse_checker("mypy") == Checker("mypy")
+    assert parse_checker("based=python -m mypy") == Checker(
+        "based", ("python", "-m", "mypy")
+    )
+
+
+# Prints the expected messages of the files it is given, like a checker
+# agreeing with every expectation would
+FAKE_CHECKER = f"""
+import sys
+sys.path.insert(0, {str(TESTS)!r})
+from mypy_runner import collect_cases
+
+paths = [i for i in sys.argv[1:] if i.endswith(".py")]
+for case in collect_cases(map(__import__("pathlib").Path, paths)):
+    for i in case.expected:
+        print(f"{{i.path}}:{{i.line}}: {{i.severity}}: {{i.message}}  [misc]")
+"""
+
+
+def test_run_sharded(tmp_path):
+    script = tmp_path / "checker.py"
+    script.write_text(FAKE_CHECKER)
+    checkers = [
+        Checker("agrees", (sys.executable, str(script))),
+        Checker("silent", (sys.executable, "-c", "")),
+    ]
+    results = run_sharded(default_paths(), checkers, 3, tmp_path / "cache")
+    assert [(i.checker, i.case) for i in results] == [
+        (checker.name, case) for checker in checkers for case in CASES
+    ]
+    assert all(i.passed for i in results if i.checker == "agrees")
+    assert [i.case for i in results if i.checker == "silent" and not i.passed] == [
+        i for i in CASES if i.expected
+    ]
+
+
+# The locked basedmypy has no notion of Intersection, so it can't meet the
+# expectations of the cases describing the proposed semantics
+UNSUPPORTED = {
+    "mypy_test_basic.py::test_function_args",
+    "mypy_test_basic.py::test_int_and_str",
+    "mypy_test_overloads.py::test_callables",
+    "mypy_test_overloads.py::test_callables_as_protocols",
+    "mypy_test_overloads.py::test_protocols",
+    "mypy_test_typed_dict.py::test_typed_dict",
+    "mypy_test_typed_dicts.py::test_typed_dicts",
+}
+
+
+@pytest.fixture(scope="module")
+def results():
+    pytest.importorskip("mypy.api")
+    return {i.case.id: i for i in run_sharded(default_paths())}
+
+
+@pytest.mark.parametrize(
+    "case",
+    [
+        pytest.param(
+            i,
+            id=i.id,
+            marks=pytest.mark.xfail(reason="Intersection isn't supported")
+            if i.id in UNSUPPORTED
+            else (),
+        )
+        for i in CASES
+    ],
+)
+def test_expectations(case, results):
+    result = results[case.id]
+    assert result.passed, report(result)
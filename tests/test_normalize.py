@@ -0,0 +1,68 @@
+from typing import Any, Never, Optional, Protocol, Union
+
+from intersection_examples import Intersection, normalize
+
+
+class A:
+    pass
+
+
+class B:
+    pass
+
+
+class C(A):
+    pass
+
+
+def test_order_does_not_matter():
+    assert Intersection[A, B] is Intersection[B, A]
+    assert normalize((B, A)) == ((A, B), False)
+
+
+def test_flatten():
+    assert Intersection[Intersection[A, B], int] is Intersection[A, B, int]
+    assert Intersection[A, Intersection[B, A]] is Intersection[A, B]
+
+
+def test_single_element():
+    assert Intersection[A] is A
+    assert Intersection[A, A] is A
+    assert Intersection[A, Any] is A
+    assert Intersection[Any, Any] is Any
+
+
+def test_subclass_is_kept():
+    assert Intersection[A, C] is C
+    assert Intersection[B, C, A] is Intersection[B, C]
+    assert Intersection[int, bool] is bool
+
+
+def test_generic_alias_is_kept():
+    assert Intersection[list, list[int]] == list[int]
+    assert Intersection[list[int], object] == list[int]
+    LA = Intersection[A, list[int], list]
+    assert LA.must_subclass == (list[int], A)
+    assert list in LA.materialize().__mro__
+
+
+def test_protocol_is_kept():
+    class P(Protocol):
+        a: int
+
+    assert Intersection[A, P].__intersects__ == (A, P)
+
+
+def test_never():
+    assert Intersection[A, Never] is Never
+    assert Intersection[A, None].__never__
+    assert Intersection[int, str].__never__
+    assert Intersection[A, list[int], dict].__never__
+    assert not Intersection[A, B].__never__
+
+
+def test_distribute_union():
+    assert Intersection[A | B, int] == Union[Intersection[A, int], Intersection[B, int]]
+    assert Intersection[A | B] == Union[A, B]
+    assert Intersection[Optional[A], B] is Intersection[A, B]
+    assert Intersection[int | str, bytes].__never__
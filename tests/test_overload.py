@@ -0,0 +1,125 @@
+import pickle
+from inspect import signature
+from itertools import product
+from typing import Iterable, overload
+
+import pytest
+
+from intersection_examples import Intersection, Overload, signature_matches
+
+
+class A:
+    @overload
+    def foo(self, x: int) -> int:
+        ...
+
+    @overload
+    def foo(self, x: str) -> str:
+        ...
+
+    @overload
+    def foo(self, x: int, y: int) -> tuple[int, int]:
+        ...
+
+    @overload
+    def foo(self, *args: bytes) -> bytes:
+        ...
+
+    def foo(self, *args):
+        ...
+
+
+class B:
+    pass
+
+
+def test_resolved_overload():
+    foo = Intersection[A, B].foo
+    assert isinstance(foo, Overload)
+    assert len(foo) == 4
+    assert str(foo).startswith("Overload[(self, x: int) -> int,(self, x: str) -> str")
+
+
+def test_hash_and_equality():
+    foo = Intersection[A, B].foo
+    same = Overload(list(foo))
+    assert same == foo
+    assert {foo: 1}[same] == 1
+    with pytest.raises(AttributeError):
+        foo.signatures = ()
+
+
+def test_select():
+    foo = Intersection[A, B].foo
+    a = A()
+    assert foo.select(a, 1).return_annotation is int
+    assert foo.select(a, "1").return_annotation is str
+    assert foo.select(a, 1, 2).return_annotation == tuple[int, int]
+    assert foo.select(a, b"1", b"2", b"3").return_annotation is bytes
+    assert foo.select(a).return_annotation is bytes
+    assert foo.select(a, x="1").return_annotation is str
+    with pytest.raises(TypeError):
+        foo.select(a, 1.0)
+
+
+def test_candidates_are_indexed():
+    foo = Intersection[A, B].foo
+    assert foo.candidates((A(), 1)) == (0,)
+    assert foo.candidates((A(), True)) == (0,)
+    assert foo.candidates((A(), "1")) == (1,)
+    assert foo.candidates((A(), 1, 2, 3)) == (3,)
+
+
+def test_match_is_first_matching_signature():
+    def variadic(self, *args: bytes) -> None:
+        ...
+
+    def iterable(self, x: Iterable) -> None:
+        ...
+
+    def pair(self, x: int, y: str = "") -> None:
+        ...
+
+    def anything(self, *args: object) -> None:
+        ...
+
+    def keywords(self, x: list, **kwargs: int) -> None:
+        ...
+
+    funcs = Overload(
+        [signature(i) for i in (variadic, iterable, pair, keywords, anything)]
+    )
+    values = [b"1", [1], 1, "1", None]
+    for count in range(4):
+        for args in product(values, repeat=count):
+            args = (A(), *args)
+            scan = [
+                x
+                for x, i in enumerate(funcs.signatures)
+                if signature_matches(i, args, {})
+            ]
+            if scan:
+                assert funcs.match(*args) == scan[0]
+            else:
+                with pytest.raises(TypeError):
+                    funcs.match(*args)
+    assert funcs.match(A(), [1], a=1) == 3
+    with pytest.raises(TypeError):
+        funcs.match(A(), [1], a="1")
+
+
+def test_keyword_only():
+    def func(a: int, *, b: int) -> None:
+        ...
+
+    def other(a: str) -> None:
+        ...
+
+    funcs = Overload([signature(func), signature(other)])
+    assert funcs.candidates((1,)) == (1,)
+    assert funcs.select(1, b=2) == signature(func)
+
+
+def test_pickle():
+    foo = Intersection[A, B].foo
+    assert pickle.loads(pickle.dumps(foo)) == foo
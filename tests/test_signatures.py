@@ -0,0 +1,130 @@
+import gc
+from functools import lru_cache
+from inspect import signature
+from typing import overload
+
+import intersection_examples.signatures
+from intersection_examples import (
+    CacheInfo,
+    Intersection,
+    clear_caches,
+    get_signatures,
+    signature_cache_info,
+)
+
+
+class A:
+    @overload
+    def foo(self, x: int) -> int:
+        ...
+
+    @overload
+    def foo(self, x: str) -> str:
+        ...
+
+    def foo(self, x: int | str) -> int | str:
+        ...
+
+    def bar(self) -> None:
+        ...
+
+
+@overload
+def cached(x: int) -> int:
+    ...
+
+
+@overload
+def cached(x: str) -> str:
+    ...
+
+
+@lru_cache
+def cached(x: int | str) -> int | str:
+    return x
+
+
+def test_overloads():
+    clear_caches()
+    signatures = get_signatures(A.foo)
+    assert [str(i) for i in signatures] == [
+        "(self, x: int) -> int",
+        "(self, x: str) -> str",
+    ]
+    assert get_signatures(A.foo) is signatures
+    assert get_signatures(A.bar) == (signature(A.bar),)
+    assert signature_cache_info() == CacheInfo(hits=1, misses=2, currsize=2)
+
+
+def test_overloaded_wrapper():
+    assert [str(i) for i in get_signatures(cached)] == [
+        "(x: int) -> int",
+        "(x: str) -> str",
+    ]
+
+
+def test_shared_between_intersections():
+    class B:
+        pass
+
+    class C:
+        pass
+
+    clear_caches()
+    Intersection[A, B].bar
+    Intersection[A, C].bar
+    assert signature_cache_info() == CacheInfo(hits=1, misses=1, currsize=1)
+
+
+def test_builtins():
+    clear_caches()
+    get_signatures(str.strip)
+    get_signatures(str.strip)
+    assert signature_cache_info() == CacheInfo(hits=1, misses=1, currsize=1)
+
+
+def test_bound_methods():
+    class B:
+        @classmethod
+        def make(cls, x: int) -> "B":
+            ...
+
+    clear_caches()
+    for _ in range(5):
+        assert get_signatures(B.make) == (signature(B.make),)
+    assert get_signatures(B.__dict__["make"].__func__) == (
+        signature(B.__dict__["make"].__func__),
+    )
+    assert signature_cache_info() == CacheInfo(hits=4, misses=2, currsize=2)
+
+
+def test_weak_references():
+    def func(a: int) -> int:
+        ...
+
+    clear_caches()
+    get_signatures(func)
+    del func
+    gc.collect()
+    assert signature_cache_info().currsize == 0
+
+
+def test_least_recently_used(monkeypatch):
+    def first() -> None:
+        ...
+
+    def second() -> None:
+        ...
+
+    def third() -> None:
+        ...
+
+    monkeypatch.setattr(intersection_examples.signatures, "SIGNATURE_CACHE_SIZE", 2)
+    clear_caches()
+    get_signatures(first)
+    get_signatures(second)
+    get_signatures(first)
+    get_signatures(third)
+    get_signatures(first)
+    get_signatures(second)
+    assert signature_cache_info() == CacheInfo(hits=2, misses=4, currsize=2)
@@ -0,0 +1,94 @@
+from itertools import combinations
+
+import pytest
+
+from intersection_examples import (
+    Intersection,
+    has_layout_conflict,
+    layout_conflict,
+    solid_base,
+)
+
+
+class Slotted:
+    __slots__ = ("a",)
+
+
+class OtherSlotted:
+    __slots__ = ("b",)
+
+
+class Plain:
+    pass
+
+
+class MyInt(int):
+    pass
+
+
+class MyError(ValueError):
+    pass
+
+
+subclassable = (
+    int,
+    float,
+    str,
+    bytes,
+    bytearray,
+    type,
+    BaseException,
+    set,
+    list,
+    tuple,
+    dict,
+    frozenset,
+    complex,
+    Slotted,
+    OtherSlotted,
+    Plain,
+    MyInt,
+    MyError,
+    OSError,
+)
+
+
+@pytest.mark.parametrize("a", subclassable)
+@pytest.mark.parametrize("b", subclassable)
+def test_matches_class_creation(a, b):
+    try:
+        type("foo", (a, b), {})
+    except TypeError:
+        possible = issubclass(a, b) or issubclass(b, a)
+    else:
+        possible = True
+    assert layout_conflict(a, b) is not possible
+
+
+@pytest.mark.parametrize("size", [1, 2, 3])
+def test_conflict_in_one_pass(size):
+    for components in combinations(subclassable, size):
+        pairwise = any(layout_conflict(a, b) for a, b in combinations(components, 2))
+        assert has_layout_conflict(components) is pairwise
+        assert has_layout_conflict(reversed(components)) is pairwise
+
+
+def test_solid_base():
+    assert solid_base(Plain) is object
+    assert solid_base(Slotted) is Slotted
+    assert solid_base(MyError) is BaseException
+    assert solid_base(OSError) is OSError
+
+
+def test_is_never():
+    assert Intersection[int, str].is_never
+    assert Intersection[Slotted, OtherSlotted].is_never
+    assert Intersection[list[int], dict[str, int]].is_never
+    assert not Intersection[Plain, Slotted].is_never
+    assert not Intersection[MyError, OSError].is_never
+
+
+def test_must_subclass():
+    assert Intersection[Plain, Slotted].must_subclass == (Plain, Slotted)
+    with pytest.raises(TypeError):
+        Intersection[int, str].must_subclass
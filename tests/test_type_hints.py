@@ -1,8 +1,28 @@
+import gc
 from typing import Protocol
 
+import pytest
+
+import intersection_examples
 from intersection_examples import Intersection, get_type_hints
 
 
+@pytest.fixture
+def calls(monkeypatch):
+    """The objects passed to typing.get_type_hints"""
+    out = []
+    original = intersection_examples.typing_get_type_hints
+
+    def typing_get_type_hints(obj):
+        out.append(obj)
+        return original(obj)
+
+    monkeypatch.setattr(
+        intersection_examples, "typing_get_type_hints", typing_get_type_hints
+    )
+    return out
+
+
 def test_class_intersect():
     class A(str):
         a: str
@@ -34,3 +54,51 @@ def test_differing_methods():
     AB = Intersection[A, B]
 
     assert get_type_hints(AB) == get_type_hints(AB_proto)
+
+
+def test_clashing_hints():
+    class A:
+        common: int
+        a: "list[int]"
+
+    class B:
+        common: str
+
+    hints = get_type_hints(Intersection[A, B])
+    assert hints == {"common": Intersection[int, str], "a": list[int]}
+    assert hints["common"].is_never
+
+
+def test_hints_are_memoized(calls):
+    class A:
+        a: int
+
+    class B:
+        b: "str"
+
+    AB = Intersection[A, B]
+    hints = get_type_hints(AB)
+    hints["c"] = bytes
+    assert get_type_hints(AB) == {"a": int, "b": str}
+    assert get_type_hints(AB) is not get_type_hints(AB)
+    assert calls == [A, B]
+
+
+def test_hints_are_memoized_without_reference(calls):
+    class A:
+        a: int
+
+    class B:
+        b: str
+
+    for _ in range(3):
+        assert get_type_hints(Intersection[A, B]) == {"a": int, "b": str}
+        gc.collect()
+    assert calls == [A, B]
+
+
+def test_other_objects():
+    def func(a: int) -> str:
+        ...
+
+    assert get_type_hints(func) == {"a": int, "return": str}
@@ -0,0 +1,70 @@
+import typing
+
+import pytest
+
+from intersection_examples import (
+    EagerIntersection,
+    Intersection,
+    get_type_hints,
+    merge_typed_dicts,
+)
+
+
+class A(typing.TypedDict):
+    a: int
+    common: str
+
+
+class B(typing.TypedDict, total=False):
+    b: float
+    common: bytes
+
+
+def test_merged_typed_dict():
+    AB = Intersection[A, B]
+    merged = AB.typed_dict
+    assert typing.is_typeddict(merged)
+    assert typing.get_type_hints(merged) == {
+        "a": int,
+        "b": float,
+        "common": str | bytes,
+    }
+    assert merged.__required_keys__ == {"a", "common"}
+    assert merged.__optional_keys__ == {"b"}
+    assert Intersection[B, A].typed_dict is merged
+
+
+def test_type_hints():
+    assert get_type_hints(Intersection[A, B])["common"] == str | bytes
+
+
+def test_attributes_follow_merged_typed_dict():
+    AB = Intersection[A, B]
+    assert AB.common == str | bytes
+    assert AB.common == get_type_hints(AB)["common"]
+    assert AB.common == typing.get_type_hints(AB.typed_dict)["common"]
+    assert AB.a is int
+    assert AB.b is float
+    assert EagerIntersection[A, B].common == str | bytes
+
+
+def test_not_typed_dicts():
+    class C:
+        pass
+
+    with pytest.raises(TypeError):
+        Intersection[A, C].typed_dict
+    with pytest.raises(TypeError):
+        merge_typed_dicts([A, C])
+
+
+def test_required_keys():
+    AB = Intersection[A, B]
+    validate = AB.compile_validator()
+    for payload, valid in [
+        ({"a": 1, "common": "x"}, True),
+        ({"a": 1, "b": 1.0, "common": b"x", "extra": None}, True),
+        ({"a": 1, "b": 1.0}, False),
+    ]:
+        assert isinstance(payload, AB) is valid
+        assert validate(payload) is valid
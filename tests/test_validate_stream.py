@@ -0,0 +1,86 @@
+import copy
+import pickle
+from itertools import count
+from typing import TypedDict
+
+import pytest
+
+from intersection_examples import Intersection, validate_stream
+
+
+class Movie(TypedDict):
+    name: str
+    year: int
+
+
+class Based(TypedDict):
+    based_on: str
+
+
+valid = {"name": "Name", "year": 2000, "based_on": "Book"}
+invalid = {"name": "Name", "year": 2000}
+
+
+def test_results_in_order():
+    records = [valid, invalid, valid, valid, invalid]
+    results = validate_stream(Intersection[Movie, Based], records, chunk_size=2)
+    assert list(results) == [True, False, True, True, False]
+
+
+def test_chunk_size_must_be_positive():
+    for chunk_size in (0, -1):
+        results = validate_stream(Intersection[Movie, Based], [valid], chunk_size)
+        with pytest.raises(ValueError):
+            list(results)
+
+
+def test_fail_fast():
+    records = [valid, valid, valid, invalid, valid]
+    results = validate_stream(
+        Intersection[Movie, Based], records, chunk_size=2, fail_fast=True
+    )
+    assert list(results) == [True, True, True, False]
+
+
+def test_fail_fast_stops_reading():
+    records = iter([valid, invalid, valid, valid])
+    results = validate_stream(Intersection[Movie, Based], records, fail_fast=True)
+    assert list(results) == [True, False]
+    assert list(records) == [valid, valid]
+
+
+def test_lazy():
+    records = (valid if i % 2 else invalid for i in count())
+    results = validate_stream(Intersection[Movie, Based], records, chunk_size=3)
+    assert [next(results) for _ in range(4)] == [False, True, False, True]
+
+
+def test_not_an_intersection():
+    assert list(validate_stream(int, [1, "1"])) == [True, False]
+
+
+def test_pickle():
+    MovieBook = Intersection[Movie, Based]
+    assert pickle.loads(pickle.dumps(MovieBook)) is MovieBook
+    assert copy.deepcopy(MovieBook) is MovieBook
+
+
+def test_parallel():
+    records = [valid, invalid] * 50
+    results = validate_stream(
+        Intersection[Movie, Based], records, chunk_size=7, parallel=True, workers=2
+    )
+    assert list(results) == [True, False] * 50
+
+
+def test_parallel_fail_fast():
+    records = [valid] * 20 + [invalid] + [valid] * 20
+    results = validate_stream(
+        Intersection[Movie, Based],
+        records,
+        chunk_size=3,
+        fail_fast=True,
+        parallel=True,
+        workers=2,
+    )
+    assert list(results) == [True] * 20 + [False]
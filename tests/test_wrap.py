@@ -0,0 +1,116 @@
+import dataclasses
+from typing import Protocol, runtime_checkable
+
+import pytest
+
+from intersection_examples import Intersection
+
+
+class Enhanced(Protocol):
+    enhanced: bool
+
+
+@dataclasses.dataclass
+class X:
+    bar: str
+
+    def hello(self) -> str:
+        return "Hello " + self.bar
+
+
+def test_wrap_forwards_and_adds():
+    x = X("foo")
+    proxy = Intersection[X, Enhanced].wrap(x, enhanced=True)
+    assert proxy.__wrapped__ is x
+    assert proxy.bar == "foo"
+    assert proxy.hello() == "Hello foo"
+    assert proxy.enhanced is True
+
+
+def test_writes_forwarded():
+    x = X("foo")
+    proxy = Intersection[X, Enhanced].wrap(x, enhanced=True)
+    proxy.bar = "baz"
+    proxy.enhanced = False
+    assert x.bar == "baz"
+    assert proxy.enhanced is False
+    assert not hasattr(x, "enhanced")
+
+
+def test_instance_attributes_forwarded():
+    x = X("foo")
+    x.other = 1
+    assert Intersection[X, Enhanced].wrap(x, enhanced=True).other == 1
+
+
+def test_proxy_class_cached():
+    XE = Intersection[X, Enhanced]
+    first = XE.wrap(X("a"), enhanced=True)
+    second = XE.wrap(X("b"), enhanced=False)
+    assert type(first) is type(second)
+    assert type(XE.wrap(X("c"), enhanced=True, more=1)) is not type(first)
+
+
+def test_missing_protocol_member():
+    with pytest.raises(TypeError):
+        Intersection[X, Enhanced].wrap(X("foo"))
+
+
+def test_wrong_nominal_type():
+    class Y:
+        pass
+
+    with pytest.raises(TypeError):
+        Intersection[X, Enhanced].wrap(Y(), enhanced=True)
+
+
+def test_used_as_intersection():
+    @runtime_checkable
+    class Checked(Protocol):
+        enhanced: bool
+
+    XC = Intersection[X, Checked]
+    x = X("foo")
+    proxy = XC.wrap(x, enhanced=True)
+    assert isinstance(proxy, XC)
+    assert isinstance(proxy, X)
+    assert proxy.__class__ is X
+    assert XC.compile_validator()(proxy)
+    assert not isinstance(x, XC)
+    assert proxy == x
+    assert repr(proxy) == repr(x)
+
+
+class Sized(Protocol):
+    tag: str
+
+
+def test_special_methods_forwarded():
+    proxy = Intersection[list, Sized].wrap([1, 2], tag="t")
+    assert len(proxy) == 2
+    assert list(proxy) == [1, 2]
+    assert proxy[1] == 2
+    assert 1 in proxy
+    assert proxy
+    proxy.append(3)
+    assert proxy == [1, 2, 3]
+
+
+def test_callable_forwarded():
+    class Adder:
+        def __call__(self, x: int) -> int:
+            return x + 1
+
+    proxy = Intersection[Adder, Sized].wrap(Adder(), tag="t")
+    assert proxy(1) == 2
+    assert callable(proxy)
+
+
+def test_instance_attribute_writes_forwarded():
+    x = X("foo")
+    proxy = Intersection[X, Enhanced].wrap(x, enhanced=True)
+    proxy.other = 1
+    assert x.other == 1
+    assert proxy.other == 1
+    del proxy.other
+    assert not hasattr(x, "other")